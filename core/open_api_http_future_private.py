@@ -1,6 +1,7 @@
 import json
 from typing import Dict, Optional, Any, List
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 from pathlib import Path
 from core.config import Config
@@ -12,6 +13,8 @@ import uuid
 
 # HTTP Timeout als Konstante (core-spezifisch)
 HTTP_TIMEOUT_SECONDS = 30
+# Keep-Alive-Pool: groß genug für parallele Order-Calls (Default wäre 10)
+HTTP_POOL_SIZE = 32
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s')
 
@@ -23,6 +26,10 @@ class OpenApiHttpFuturePrivate:
         self.secret_key = config.secret_key
         self.base_url = config.uri_prefix
         self.session = requests.Session()
+        # Verbindungen wiederverwenden statt pro Request neu aufbauen (TLS-Handshake)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "language": "en-US",
             "Content-Type": "application/json"
@@ -115,6 +122,24 @@ class OpenApiHttpFuturePrivate:
         r = self.session.post(url, json=data, headers=headers, timeout=self.timeout)
         return self._handle_response(r)
 
+    def place_orders_batch(self, symbol: str, order_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        url = f"{self.base_url}/api/v1/futures/trade/batch_order"
+        if not order_list:
+            raise ValueError("order_list cannot be empty")
+        for order in order_list:
+            ot = str(order.get("orderType", "")).upper()
+            if ot not in ("LIMIT", "MARKET"):
+                raise ValueError("orderType must be 'LIMIT' or 'MARKET'.")
+            if ot == "LIMIT" and not order.get("price"):
+                raise ValueError("price is required for LIMIT orders.")
+            if not order.get("clientId"):
+                order["clientId"] = f"{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        data = {"symbol": symbol, "orderList": order_list}
+        body = json.dumps(data)
+        headers = get_auth_headers(self.api_key, self.secret_key, body=body)
+        r = self.session.post(url, json=data, headers=headers, timeout=self.timeout)
+        return self._handle_response(r)
+
     def modify_order(self, order_id: Optional[str] = None, client_id: Optional[str] = None, 
                     price: Optional[str] = None, qty: Optional[str] = None,
                     tp_price: Optional[str] = None, tp_order_price: Optional[str] = None, 
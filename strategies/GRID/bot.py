@@ -27,6 +27,7 @@ from core.open_api_ws_future_public import OpenApiWsFuturePublic
 from core.open_api_ws_future_private import OpenApiWsFuturePrivate
 
 from manager.grid_manager import GridManager
+from manager.hedge_manager import hedge_target
 from manager.grid_lifecycle import GridState
 from manager.account_sync import AccountSync
 
@@ -91,33 +92,25 @@ class GridBot:
                     if current_minute != last_logged_minute:
                         # Grid-Status sammeln
                         total = len(self.grid.levels)
-                        active = sum(1 for l in self.grid.levels if l.active)
-                        filled = sum(1 for l in self.grid.levels if l.filled)
+                        book = self.grid.position_tracker.book
+                        active = book.n_active
+                        filled = book.n_filled
                         
                         # ===== HEDGE STATUS BERECHNEN =====
                         if getattr(self.grid.hedge_manager.config, "enabled", False):
-                            # Grid-Bounds holen
-                            price_list = self.grid.calculator.calculate_price_list()
-                            lower_bound = price_list[0]
-                            upper_bound = price_list[-1]
-                            step = abs(price_list[1] - price_list[0]) if len(price_list) > 1 else 0
+                            # Grid-Bounds holen (Cache aus GridManager)
+                            lower_bound, upper_bound, step = self.grid.get_grid_bounds()
                             
                             # Net Position (LIVE)
                             net_pos = self.grid.position_tracker.get_net_position()
                             
                             # Hedge-Parameter berechnen
-                            if self.grid.grid_direction == "long":
-                                hedge_price = lower_bound - step
-                                sl_price = hedge_price + (2 * step)
-                                hedge_qty = abs(net_pos) if abs(net_pos) > 0.001 else self.grid.grid_conf.base_order_size
-                                
-                            elif self.grid.grid_direction == "short":
-                                hedge_price = upper_bound + step
-                                sl_price = hedge_price - (2 * step)
+                            side, hedge_price, sl_price = hedge_target(
+                                self.grid.grid_direction, lower_bound, upper_bound, step
+                            )
+                            if side is not None:
                                 hedge_qty = abs(net_pos) if abs(net_pos) > 0.001 else self.grid.grid_conf.base_order_size
                             else:
-                                hedge_price = None
-                                sl_price = None
                                 hedge_qty = 0
                             
                             # Status-Symbol
@@ -211,9 +204,9 @@ class GridBot:
                 state = self.grid.lifecycle.state
 
                 if not hasattr(self, "_last_sync_check"):
-                    self._last_sync_check = 0
+                    self._last_sync_check = float("-inf")  # monotone Zeit → erster Check sofort
 
-                now = time.time()
+                now = time.monotonic()
                 if now - self._last_sync_check >= AUTO_SYNC_CHECK_INTERVAL:
                     self._last_sync_check = now
                     asyncio.create_task(self._auto_sync_check())
@@ -273,10 +266,7 @@ class GridBot:
             # Hedge nach Sync aktualisieren
             if result.get('placed', 0) > 0:
                 self.grid._update_net_position()
-                price_list = self.grid.calculator.calculate_price_list()
-                lower_bound = price_list[0]
-                upper_bound = price_list[-1]
-                step = abs(price_list[1] - price_list[0]) if len(price_list) > 1 else 0
+                lower_bound, upper_bound, step = self.grid.get_grid_bounds()
                 
                 self.grid.hedge_manager.update_preemptive_hedge(
                     net_position_size=self.grid.net_position_size,
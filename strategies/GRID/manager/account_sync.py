@@ -27,13 +27,14 @@ class AccountSync:
         self.client = client_pri
         self.symbol = symbol
         self.logger = logging.getLogger("AccountSync")
-        self.last_sync = 0
+        self.last_sync = float("-inf")  # monotone Zeit → erster Sync sofort
         self.balance = 0.0
         self.balance_coin = "USDT"
         self.orders: Dict[str, Dict[str, Any]] = {}
         self.positions: Dict[str, Dict[str, Any]] = {}
         self.ws_connected = False
         self.grid_manager = None 
+        self._last_sync_call = float("-inf")
 
     def _update_balance_http(self):
         """Fallback: Balance über HTTP abrufen"""
@@ -50,7 +51,7 @@ class AccountSync:
             
             self.balance = new_balance
             self.balance_coin = res.get("marginCoin", "USDT")
-            self.last_sync = time.time()
+            self.last_sync = time.monotonic()
         except Exception as e:
             self.logger.error(f"HTTP Balance error: {e}")
 
@@ -78,10 +79,10 @@ class AccountSync:
             price = data.get("price", "N/A")
 
             if status in ("open", "new", "working"):
-                self.logger.info(f"🟢 Order: {side} {qty}@{price}")
+                self.logger.info("🟢 Order: %s %s@%s", side, qty, price)
             
             elif status in ("filled", "partially_filled"):
-                self.logger.info(f"✅ Filled: {side} {qty} @ {price}")
+                self.logger.info("✅ Filled: %s %s @ %s", side, qty, price)
                 
                 # ✅ NEU: Rufe GridManager-Handler auf
                 if self.grid_manager:
@@ -110,7 +111,7 @@ class AccountSync:
             
             # ✅ NEU: Position-Close erkennen
             if event in ("close", "liquidate"):
-                self.logger.info(f"🔔 Position {pos_id} geschlossen → Event={event}")
+                self.logger.info("🔔 Position %s geschlossen → Event=%s", pos_id, event)
                 if self.grid_manager:
                     self._handle_position_close(data)
                 return
@@ -121,7 +122,7 @@ class AccountSync:
             qty = data.get("qty", "N/A")
             entry = data.get("entryValue", "N/A")
             self.ws_connected = True
-            self.logger.info(f"📈 Position: {side} {qty} @ {entry}")
+            self.logger.info("📈 Position: %s %s @ %s", side, qty, entry)
             
         except Exception as e:
             self.logger.error(f"Position update error: {e}")
@@ -140,12 +141,8 @@ class AccountSync:
             
             price = float(order_data.get("price", 0))
             
-            # Finde entsprechendes Grid-Level
-            matched_level = None
-            for lvl in self.grid_manager.levels:
-                if abs(lvl.price - price) < 0.0001:  # Toleranz
-                    matched_level = lvl
-                    break
+            # Finde entsprechendes Grid-Level (Binary Search)
+            matched_level = self.grid_manager.find_level(price, 0.0001)
             
             if not matched_level:
                 self.logger.warning(f"⚠️ Kein Grid-Level für gefüllte Order @ {price}")
@@ -208,12 +205,8 @@ class AccountSync:
             
             price = float(order_data.get("price", 0))
             
-            # Finde entsprechendes Grid-Level
-            matched_level = None
-            for lvl in self.grid_manager.levels:
-                if abs(lvl.price - price) < 0.0001:
-                    matched_level = lvl
-                    break
+            # Finde entsprechendes Grid-Level (Binary Search)
+            matched_level = self.grid_manager.find_level(price, 0.0001)
             
             if not matched_level:
                 return
@@ -235,16 +228,16 @@ class AccountSync:
 
     def sync(self, ws_enabled: bool = True, force: bool = False):
         """Periodischer Abgleich mit Throttling"""
-        now = time.time()
+        now = time.monotonic()
         
         # ✅ FIX: Throttling - nur alle X Sekunden aufrufen
-        if not force and (now - getattr(self, "_last_sync_call", 0)) < 5:
+        if not force and (now - self._last_sync_call) < 5:
             return self.balance
         
         self._last_sync_call = now
         
         if ws_enabled and self.ws_connected:
-            self.logger.debug(f"Balance: {self.balance:.2f} {self.balance_coin}")
+            self.logger.debug("Balance: %.2f %s", self.balance, self.balance_coin)
             return self.balance
 
         # HTTP Fallback mit Intervall-Check
@@ -260,6 +253,10 @@ class AccountSync:
             raise InsufficientBalanceError(required, self.balance)
         return True
 
+    def snapshot_orders(self) -> tuple:
+        """Immutable Snapshot der bekannten Orders (Tuple statt Liste – nur iteriert)"""
+        return tuple(self.orders.values())
+
     def preload_pending_orders(self):
         """Lädt offene Orders über HTTP"""
         try:
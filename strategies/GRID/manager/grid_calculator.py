@@ -4,12 +4,13 @@ GridCalculator - Preisgrid-Berechnung isoliert
 Zuständig für:
 - Preisraster-Generierung (arithmetisch/geometrisch)
 - Tick-Rundung
-- Grid-Hash-Berechnung (Cache)
+- Config-Schlüssel für den Preisraster-Cache
 """
 
-import hashlib
 import logging
-from typing import List
+from typing import Tuple
+
+import numpy as np
 from models.config_models import GridMode
 
 
@@ -27,11 +28,29 @@ class GridCalculator:
         self.config = grid_config
         self.logger = logger or logging.getLogger("GridCalculator")
         
-        # Cache
-        self._cached_prices: List[float] = []
-        self._cache_hash: str = ""
+        # Cache (Tuple für die Level-Logik, ndarray für Vektor-Rechnungen)
+        self._cached_prices: Tuple[float, ...] = ()
+        self._cached_price_array: np.ndarray = np.empty(0)
+        self._cache_key: tuple = ()
+        
+        # Typisierte Config-Werte (einmal geparst, neu bei geändertem Config-Key)
+        self._lower: float = 0.0
+        self._upper: float = 0.0
+        self._n: int = 0
+        self._mode = None
+        self._tick: float = 0.0
+        self._parse_config()
+
+    def _parse_config(self) -> None:
+        """Grid-Config einmal in typisierte Attribute übernehmen (float/int-Casts)"""
+        config = self.config
+        self._lower = float(config.lower_price)
+        self._upper = float(config.upper_price)
+        self._n = int(config.grid_levels)
+        self._mode = config.grid_mode
+        self._tick = float(config.min_price_step)
 
-    def calculate_price_list(self, force_refresh: bool = False) -> List[float]:
+    def calculate_price_list(self, force_refresh: bool = False) -> Tuple[float, ...]:
         """
         Generiert Liste von Preisniveaus
         
@@ -39,20 +58,22 @@ class GridCalculator:
             force_refresh: Cache ignorieren und neu berechnen
         
         Returns:
-            Liste von gerundeten Preisen
+            Tuple von gerundeten Preisen (unveränderlich – wird als Cache
+            direkt an alle Aufrufer weitergegeben)
         """
         # === Cache-Check ===
-        current_hash = self._compute_config_hash()
+        current_key = self.config_key()
         
-        if not force_refresh and self._cached_prices and self._cache_hash == current_hash:
+        if not force_refresh and self._cached_prices and self._cache_key == current_key:
             self.logger.debug("Preisraster aus Cache")
             return self._cached_prices
         
-        # === Neu berechnen ===
-        lower = float(self.config.lower_price)
-        upper = float(self.config.upper_price)
-        n = int(self.config.grid_levels)
-        mode = self.config.grid_mode
+        # === Neu berechnen (Config ggf. neu parsen) ===
+        self._parse_config()
+        lower = self._lower
+        upper = self._upper
+        n = self._n
+        mode = self._mode
         
         if mode == GridMode.LINEAR:
             prices = self._linear_grid(lower, upper, n)
@@ -61,32 +82,43 @@ class GridCalculator:
         else:
             raise ValueError(f"Unbekannter grid_mode: {mode}")
         
-        # Tick-Rundung
-        prices = [self.round_to_tick(p) for p in prices]
+        # Tick-Rundung für das ganze Raster (bitgleich zu round_to_tick)
+        price_array = self.round_to_tick_array(prices)
+        price_array.flags.writeable = False
+        prices = tuple(price_array.tolist())
         
         # Cache speichern
         self._cached_prices = prices
-        self._cache_hash = current_hash
+        self._cached_price_array = price_array
+        self._cache_key = current_key
         
         # self.logger.info(f"Preisraster berechnet: {len(prices)} Levels ({mode.value})")
         return prices
 
-    def _linear_grid(self, lower: float, upper: float, n: int) -> List[float]:
+    def calculate_price_array(self) -> np.ndarray:
+        """Preisraster als (read-only) float64-Array, gleicher Cache wie calculate_price_list"""
+        self.calculate_price_list()
+        return self._cached_price_array
+
+    def _linear_grid(self, lower: float, upper: float, n: int) -> np.ndarray:
         """
         Gleichmäßige Preisabstände
         
+        lower + i·step statt np.linspace: gleiche Float-Operationen wie die
+        frühere Python-Schleife, dadurch bitgleiche Preise.
+        
         Args:
             lower: Untere Grenze
             upper: Obere Grenze
             n: Anzahl Zwischenschritte
         
         Returns:
-            Liste mit n+1 Preisen
+            Array mit n+1 Preisen
         """
         step = (upper - lower) / n
-        return [lower + i * step for i in range(n + 1)]
+        return lower + np.arange(n + 1, dtype=np.float64) * step
 
-    def _logarithmisch_grid(self, lower: float, upper: float, n: int) -> List[float]:
+    def _logarithmisch_grid(self, lower: float, upper: float, n: int) -> np.ndarray:
         """
         Prozentuale Preisabstände (logarithmisch)
         
@@ -96,10 +128,10 @@ class GridCalculator:
             n: Anzahl Zwischenschritte
         
         Returns:
-            Liste mit n+1 Preisen
+            Array mit n+1 Preisen
         """
         ratio = (upper / lower) ** (1.0 / n)
-        return [lower * (ratio ** i) for i in range(n + 1)]
+        return lower * ratio ** np.arange(n + 1, dtype=np.float64)
 
     def round_to_tick(self, price: float) -> float:
         """
@@ -111,24 +143,47 @@ class GridCalculator:
         Returns:
             Gerundeter Preis
         """
-        tick = float(self.config.min_price_step)
+        # Division statt Multiplikation mit 1/tick: bei Halb-Tick-Preisen
+        # (z. B. Prozent-TP/SL) kippt der Kehrwert sonst die Rundungsrichtung
+        tick = self._tick
         return round(round(price / tick) * tick, 12)
 
-    def _compute_config_hash(self) -> str:
+    def round_to_tick_array(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Array-Variante von round_to_tick (NaN bleibt NaN)
+        
+        Snapping in NumPy, round(…, 12) pro Element (np.round ist nicht bitgleich).
+        
+        Args:
+            prices: Ursprüngliche Preise (float64)
+        
+        Returns:
+            Gerundete Preise (float64)
+        """
+        tick = self._tick
+        snapped = np.rint(prices / tick) * tick
+        return np.fromiter(
+            (round(p, 12) for p in snapped.tolist()), dtype=np.float64, count=snapped.size
+        )
+
+    def config_key(self) -> tuple:
         """
-        Berechnet Hash aus Grid-Config für Cache-Prüfung
+        Schlüssel aus Grid-Config für Cache-Prüfung
+        
+        Tuple-Vergleich statt MD5 über einen formatierten String – ein
+        Cache-Treffer kostet so nur fünf Attribut-Zugriffe.
         
         Returns:
-            MD5-Hash der relevanten Config-Parameter
+            Tuple der relevanten Config-Parameter
         """
-        config_str = (
-            f"{self.config.lower_price}|"
-            f"{self.config.upper_price}|"
-            f"{self.config.grid_levels}|"
-            f"{self.config.grid_mode.value}|"
-            f"{self.config.min_price_step}"
+        config = self.config
+        return (
+            config.lower_price,
+            config.upper_price,
+            config.grid_levels,
+            config.grid_mode,
+            config.min_price_step,
         )
-        return hashlib.md5(config_str.encode()).hexdigest()
 
     def get_level_count(self) -> int:
         """Anzahl der Grid-Levels (n+1)"""
@@ -143,6 +198,6 @@ class GridCalculator:
         return self.get_grid_span() / self.config.grid_levels
 
     def invalidate_cache(self):
-        """Erzwingt Neuberechnung beim nächsten Aufruf"""
-        self._cache_hash = ""
+        """Erzwingt Neuberechnung (und neues Config-Parsing) beim nächsten Aufruf"""
+        self._cache_key = ()
         self.logger.debug("Preisraster-Cache invalidiert")
@@ -21,7 +21,7 @@ ALLOWED_TRANSITIONS: Dict[GridState, Set[GridState]] = {
     GridState.CLOSED: set(),
 }
 
-@dataclass
+@dataclass(slots=True)
 class GridLifecycle:
     symbol: str
     on_state_change: Optional[Callable[[GridState, GridState, Optional[str]], None]] = None
@@ -17,35 +17,22 @@ sys.path.insert(0, str(GRID_DIR))
 
 import logging
 import asyncio
-from dataclasses import dataclass
+import bisect
 from typing import List, Optional, Dict, Any, Set
+
+import numpy as np
 from .grid_lifecycle import GridLifecycle, GridState
 from .order_sync import OrderSync
 from .grid_calculator import GridCalculator
 from .risk_manager import RiskManager
-from .hedge_manager import HedgeManager
+from .hedge_manager import HedgeManager, hedge_target
 from .order_executor import OrderExecutor  # ← NEU
 from .position_tracker import PositionTracker  # ← NEU
 from utils.exceptions import (InvalidGridConfigError, GridInitializationError)
 from models.config_models import GridDirection
-
-
-@dataclass
-class GridLevel:
-    index: int
-    price: float
-    side: str
-    order_id: Optional[str] = None
-    active: bool = False
-    filled: bool = False
-    position_open: bool = False
-    position_id: Optional[str] = None
-    tp: Optional[float] = None
-    sl: Optional[float] = None
-
-    def __repr__(self) -> str:
-        status = "FILLED" if self.filled else ("ACTIVE" if self.active else "IDLE")
-        return f"<GridLevel #{self.index} {self.side} @ {self.price} [{status}]>"
+from models.grid_level import (
+    GridLevel, LevelBook, SIDE_BUY, SIDE_SELL, LEVEL_POSITION, warm_up_kernels
+)
 
 
 class GridManager:
@@ -60,6 +47,9 @@ class GridManager:
         self.risk_conf = config.risk
         self.strategy = config.strategy
         self.system = config.system
+        # Session-statisch → einmal auflösen statt pro Tick
+        self._entry_on_touch: bool = bool(self.strategy.entry_on_touch)
+        self._dry_run: bool = bool(self.trading.dry_run)
 
         # === Grid Direction ===
         raw_dir = self.trading.grid_direction
@@ -70,7 +60,15 @@ class GridManager:
 
         self.grid_mode: str = self.grid_direction
         self.levels: list = []
+        # Preisraster-Cache (nur bei Init/Rebalance neu berechnet)
+        self._price_list: tuple = ()
+        self._lower_bound: float = 0.0
+        self._upper_bound: float = 0.0
+        self._step: float = 0.0
         self.last_rebalance: float = 0.0
+        self._next_rebalance_at: float = 0.0  # monotone Deadline (last_rebalance + Intervall)
+        self._last_cfg_key: tuple = ()
+        self._rebalance_interval: int = int(self.grid_conf.rebalance_interval)
         self._levels_lock = asyncio.Lock()
         self.margin_mode = config.margin.mode
         self.leverage = config.margin.leverage
@@ -83,13 +81,25 @@ class GridManager:
         # Letzter bekannter Preis
         self._last_known_price = None
         
+        # Tick-Fast-Path: zuletzt voll verarbeiteter Preis + Zustand
+        self._half_tick: float = float(self.grid_conf.min_price_step) / 2.0
+        self._last_tick_price: float = float("nan")
+        self._last_tick_key: Optional[tuple] = None
+        
+        # Status-Throttling (print_grid_status)
+        self._last_status_log = None
+        
         # ✅ Task-Tracking
         self._pending_tasks: Set[asyncio.Task] = set()
+        self._initial_orders_task: Optional[asyncio.Task] = None
         
         # Logging
+        # Geteilter Logger für alle Symbole – setLevel nur bei Änderung, da
+        # jeder Aufruf die isEnabledFor-Caches aller Logger leert
         self.logger = logging.getLogger("GridManager")
-        level_name = self.system.log_level.upper()
-        self.logger.setLevel(getattr(logging, level_name, logging.INFO))
+        level = getattr(logging, self.system.log_level.upper(), logging.INFO)
+        if self.logger.level != level:
+            self.logger.setLevel(level)
 
         # Lifecycle
         self.lifecycle = GridLifecycle(self.symbol, on_state_change=self._on_state_change)
@@ -132,7 +142,7 @@ class GridManager:
         try:
             self.validate_config()
             self._create_grid_levels()
-            self.last_rebalance = time.time()
+            self._mark_rebalanced(time.monotonic())
 
             # ===== NEU: OrderExecutor initialisieren =====
             self.order_executor = OrderExecutor(
@@ -146,6 +156,11 @@ class GridManager:
                 virtual_manager=self.virtual_manager,
                 logger=self.logger
             )
+            # Live-Touch-Orders als getrackte Tasks (nicht blockierend im Loop)
+            self.order_executor.task_runner = self._track_task
+            self.order_executor.on_touch_placed = self._on_touch_placed
+            if self._entry_on_touch:
+                warm_up_kernels()  # JIT beim Start statt beim ersten Touch
 
             # ===== NEU: PositionTracker initialisieren =====
             self.position_tracker = PositionTracker(
@@ -158,20 +173,18 @@ class GridManager:
             )
             
             # ✅ FIX: Levels übergeben
-            self.position_tracker.set_levels(self.levels)
+            self._attach_levels()
 
+            # Statische Summary-Zeilen einmalig aufbauen
+            self._summary_lines = self._build_summary_lines()
             self.log_summary()
 
             self.lifecycle.set_state(GridState.ACTIVE)
             self.logger.info(f"[{self.symbol}] GridManager aktiv")
 
             # TP/SL berechnen
-            price_list = self.calculator.calculate_price_list()
-            for lvl in self.levels:
-                lvl.tp = self.risk_manager.calculate_take_profit(
-                    lvl.price, lvl.index, lvl.side, price_list
-                )
-                lvl.sl = self.risk_manager.calculate_stop_loss(lvl.price, lvl.side)
+            self._apply_tp_sl()
+            self._validate_levels()
 
             # OrderSync
             self.order_sync = OrderSync(
@@ -179,8 +192,9 @@ class GridManager:
                 levels=self.levels,
                 logger=self.logger,
                 client=self.client,
-                size=self.risk_manager.calculate_effective_size(),
+                size=self.risk_manager.effective_size,
                 grid_direction=self.grid_direction,
+                price_list=self._price_list,
             )
 
         except (InvalidGridConfigError, GridInitializationError) as e:
@@ -195,25 +209,41 @@ class GridManager:
     # ========================================
     
     def _track_task(self, coro):
-        """Erstellt Task und trackt ihn"""
+        """
+        Erstellt Task und trackt ihn
+        
+        Das Set hält bewusst starke Referenzen (asyncio referenziert Tasks nur
+        schwach – ein WeakSet ließe laufende Tasks vom GC einsammeln). Statt
+        Done-Callback pro Task werden fertige Tasks lazy beim nächsten Zugriff
+        entfernt (_prune_tasks).
+        """
+        self._prune_tasks()
         task = asyncio.create_task(coro)
         self._pending_tasks.add(task)
-        task.add_done_callback(self._pending_tasks.discard)
         return task
     
+    def _prune_tasks(self) -> None:
+        """Fertige Tasks aus dem Tracking-Set entfernen"""
+        if self._pending_tasks:
+            self._pending_tasks = {t for t in self._pending_tasks if not t.done()}
+    
     async def _cancel_all_tasks(self):
         """Cancelled alle laufenden Tasks"""
-        if not self._pending_tasks:
+        # Läuft selbst als getrackter Task (stop() im Loop) → sich nicht selbst awaiten
+        current = asyncio.current_task()
+        self._prune_tasks()
+        tasks = [t for t in self._pending_tasks if t is not current]
+        if not tasks:
             return
         
-        self.logger.info(f"🧹 Cancelling {len(self._pending_tasks)} pending tasks...")
+        self.logger.info(f"🧹 Cancelling {len(tasks)} pending tasks...")
         
-        for task in self._pending_tasks:
+        for task in tasks:
             if not task.done():
                 task.cancel()
         
-        await asyncio.gather(*self._pending_tasks, return_exceptions=True)
-        self._pending_tasks.clear()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pending_tasks.difference_update(tasks)
         self.logger.info("✅ Alle Tasks cancelled")
 
     # ========================================
@@ -237,106 +267,280 @@ class GridManager:
         if tick <= 0.0:
             raise InvalidGridConfigError(f"min_price_step ({tick}) muss > 0 sein")
 
-    def _create_grid_levels(self) -> None:
-        """Erstellt GridLevel-Objekte"""
-        price_list = self.calculator.calculate_price_list()
+    def _refresh_price_cache(self) -> None:
+        """
+        Preisraster, Grid-Bounds und tick-relevante Grid-Parameter cachen
+        (ändern sich nur bei Init/Rebalance mit geänderter Config)
+        """
+        calculator = self.calculator
+        price_list = calculator.calculate_price_list()
+        self._price_list = price_list
+        self._last_cfg_key = calculator.config_key()
+        self._lower_bound = price_list[0]
+        self._upper_bound = price_list[-1]
+        self._step = abs(price_list[1] - price_list[0]) if len(price_list) > 1 else 0.0
+        self._half_tick = float(self.grid_conf.min_price_step) / 2.0
+        self._rebalance_interval = int(self.grid_conf.rebalance_interval)
+
+    def _attach_levels(self) -> None:
+        """Ein gemeinsames LevelBook für PositionTracker und OrderExecutor"""
+        book = LevelBook(self.levels)
+        self.position_tracker.set_levels(self.levels, book)
+        self.order_executor.set_levels(self.levels, book)
+        if hasattr(self, 'order_sync'):
+            self.order_sync.set_levels(self.levels, self._price_list)
+
+    def get_grid_bounds(self) -> tuple:
+        """Gecachte Grid-Bounds (lower, upper, step) – gültig bis zum nächsten Rebalance"""
+        return self._lower_bound, self._upper_bound, self._step
+
+    def _apply_tp_sl(self) -> None:
+        """TP/SL aller Levels vektorisiert berechnen und auf die Levels schreiben"""
+        levels = self.levels
+        is_buy = np.fromiter(
+            (lvl.side_bits & SIDE_BUY for lvl in levels), dtype=bool, count=len(levels)
+        )
+        tp_arr, sl_arr = self.risk_manager.calculate_tp_sl_arrays(
+            self.calculator.calculate_price_array(), is_buy
+        )
         
-        lower = self.grid_conf.lower_price
-        upper = self.grid_conf.upper_price
-        mid = (lower + upper) / 2.0
+        # NaN (deaktiviert) → None
+        for lvl, tp, sl in zip(levels, tp_arr.tolist(), sl_arr.tolist()):
+            lvl.tp = tp if tp == tp else None
+            lvl.sl = sl if sl == sl else None
+
+    def _validate_levels(self) -> None:
+        """
+        TP/SL einmalig pro Level validieren (fix bis zum nächsten Rebalance)
         
-        self.levels = []
+        Prüfung vektorisiert; nur ungültige Levels laufen zusätzlich durch
+        validate_tp_sl, damit die Fehlermeldung je Level erhalten bleibt.
+        """
+        levels = self.levels
+        n = len(levels)
+        nan = float("nan")
+        prices = np.fromiter((lvl.price for lvl in levels), dtype=np.float64, count=n)
+        side_bits = np.fromiter((lvl.side_bits for lvl in levels), dtype=np.uint8, count=n)
+        tp = np.fromiter((nan if lvl.tp is None else lvl.tp for lvl in levels), dtype=np.float64, count=n)
+        sl = np.fromiter((nan if lvl.sl is None else lvl.sl for lvl in levels), dtype=np.float64, count=n)
+        
+        risk_manager = self.risk_manager
+        valid = risk_manager.validate_tp_sl_arrays(
+            prices, (side_bits & SIDE_BUY) != 0, (side_bits & SIDE_SELL) != 0, tp, sl
+        )
+        for lvl, ok in zip(levels, valid.tolist()):
+            lvl.valid = ok
         
-        for i, p in enumerate(price_list):
-            if self.grid_direction == "long":
-                side = "BUY"
-            elif self.grid_direction == "short":
-                side = "SELL"
-            else:
-                side = "BUY" if p <= mid else "SELL"
-            
-            self.levels.append(GridLevel(index=i, price=p, side=side))
+        invalid = n - int(np.count_nonzero(valid))
+        if invalid:
+            for i in np.flatnonzero(~valid).tolist():
+                lvl = levels[i]
+                risk_manager.validate_tp_sl(lvl.price, lvl.tp, lvl.sl, lvl.side)
+            self.logger.warning(f"⚠️ {invalid} Level(s) mit ungültigem TP/SL werden nicht platziert")
+
+    def _create_grid_levels(self) -> None:
+        """Erstellt GridLevel-Objekte"""
+        self._refresh_price_cache()
+        price_list = self._price_list
+        sides = self._level_sides(price_list)
+        self.levels = [GridLevel(i, p, s) for i, (p, s) in enumerate(zip(price_list, sides))]
+
+    def _level_sides(self, price_list) -> List[str]:
+        """Seite je Preis – Richtung einmal außerhalb der Schleife auflösen"""
+        if self.grid_direction in ("long", "short"):
+            side = "BUY" if self.grid_direction == "long" else "SELL"
+            return [side] * len(price_list)
+        
+        # both: Preisliste ist aufsteigend → Split-Index einmal per Bisektion
+        mid = (self.grid_conf.lower_price + self.grid_conf.upper_price) / 2.0
+        split = bisect.bisect_right(price_list, mid)
+        return ["BUY"] * split + ["SELL"] * (len(price_list) - split)
 
     # ========================================
     # Main Update Loop
     # ========================================
 
     def update(self, current_price: float) -> None:
-        """Hauptupdate pro Tick"""
-        try:
-            if not self.lifecycle.is_active():
-                return
+        """
+        Hauptupdate pro Tick
+        
+        Nur Virtual-Fills, Initial-Placement/Rebalance und Hedge (I/O bzw.
+        State-Umbau) laufen unter try/except. Der Entry-on-Touch-Scan bleibt
+        außerhalb – Order-Fehler fängt _place_touch_entry je Level selbst ab.
+        
+        Fast-Path: Preis innerhalb eines halben Ticks zum zuletzt verarbeiteten
+        Tick, kein Level-Status-Übergang (LevelBook.version) und Hedge-Status
+        unverändert → Fills, Touch-Scan und Hedge-Check können nichts Neues
+        ergeben, es läuft nur der Rebalance-Timer.
+        """
+        if not self.lifecycle.is_active():
+            return
 
-            self.hedge_manager.live_price = current_price
-            self._last_known_price = current_price
-            
+        # Uhr einmal pro Tick lesen (monoton → immun gegen NTP-Sprünge)
+        now = time.monotonic()
+        hedge = self.hedge_manager
+        hedge.live_price = current_price
+        self._last_known_price = current_price
+        executor = self.order_executor
+        book = self.position_tracker.book
+        
+        if (
+            executor._initial_orders_placed
+            and abs(current_price - self._last_tick_price) < self._half_tick
+            and self._last_tick_key == (book, book.version, hedge.active)
+        ):
+            try:
+                self._maybe_rebalance(now)
+            except Exception as e:
+                self._on_update_error(e)
+            return
+        
+        try:
             # Virtual Order Checks
-            if self.trading.dry_run and self.virtual_manager:
-                filled_orders = self.virtual_manager.check_fills(current_price)
-                for order in filled_orders:
-                    for lvl in self.levels:
-                        if lvl.order_id == order.order_id:
-                            self.position_tracker.handle_order_fill(lvl)
-                            break
-                
-                closed_positions = self.virtual_manager.check_tp_sl(current_price)
-                if closed_positions:
-                    for position in closed_positions:
-                        matched_level = None
-                        for lvl in self.levels:
-                            if lvl.position_open:
-                                if abs(lvl.price - position.entry_price) < 0.01:
-                                    matched_level = lvl
-                                    break
-                        
-                        if matched_level:
-                            pos_data = {"entryValue": matched_level.price}
-                            self.position_tracker.handle_position_close(
-                                pos_data, 
-                                self.levels,
-                                current_price
-                            )
+            if self._dry_run and self.virtual_manager:
+                self._process_virtual_fills(current_price)
 
             # Initial Orders (nur einmal)
-            if not self.order_executor._initial_orders_placed:
-                self.logger.info(
-                    f"[INIT]    ✅ Erster Preis empfangen: {current_price:.4f} "
-                    f"→ Platziere Grid-Orders"
-                )
-                self.order_executor.place_initial_grid_orders(self.levels, current_price)
-                self._update_and_hedge("initial_orders")
+            if not executor._initial_orders_placed:
+                # Läuft das parallele Placement noch → nichts anderes anfassen
+                if self._initial_orders_task is None:
+                    self.logger.info(
+                        "[INIT]    ✅ Erster Preis empfangen: %.4f → Platziere Grid-Orders",
+                        current_price
+                    )
+                    self._place_initial_orders(self.levels, current_price)
                 return
             
-            self._maybe_rebalance()
+            self._maybe_rebalance(now)
+        except Exception as e:
+            self._on_update_error(e)
+            return
 
-            # Entry-on-Touch
-            if bool(self.strategy.entry_on_touch):
-                placed = self.order_executor.check_new_grid_orders(self.levels, current_price)
-                if placed > 0:
-                    self._update_and_hedge("entry_on_touch")
+        # Entry-on-Touch (self.levels neu lesen – Rebalance ersetzt die Liste)
+        placed = 0
+        if self._entry_on_touch:
+            try:
+                placed = executor.check_new_grid_orders(self.levels, current_price, self._step)
+            except GridInitializationError as e:
+                self._on_update_error(e)
+                return
 
+        # Hedge
+        try:
+            if placed > 0:
+                self._update_and_hedge("entry_on_touch")
             # ✅ GEÄNDERT: Direkt _update_and_hedge aufrufen statt _check_hedge_opportunity
             self._update_and_hedge("price_update")
-
         except Exception as e:
-            self.logger.error(f"Update-Fehler: {e}")
-            self.lifecycle.set_state(GridState.ERROR, str(e))
+            self._on_update_error(e)
+        
+        # Zustand nach diesem Tick merken (Rebalance kann das Book ersetzen)
+        book = self.position_tracker.book
+        self._last_tick_price = current_price
+        self._last_tick_key = (book, book.version, hedge.active)
+
+    def _process_virtual_fills(self, current_price: float) -> None:
+        """Dry-Run: Virtuelle Fills und TP/SL-Schließungen auf Levels übertragen"""
+        vm = self.virtual_manager
+        levels = self.levels
+        tracker = self.position_tracker
+        
+        filled_orders = vm.check_fills(current_price)
+        for order in filled_orders:
+            # Order-ID → Level per Hash-Lookup (Book nach Fill neu lesen)
+            lvl = tracker.book.level_for_order(order.order_id)
+            if lvl is not None:
+                tracker.handle_order_fill(lvl)
+        
+        closed_positions = vm.check_tp_sl(current_price)
+        if closed_positions:
+            for position in closed_positions:
+                matched_level = tracker.book.find_near(
+                    position.entry_price, 0.01, LEVEL_POSITION
+                )
+                
+                if matched_level:
+                    pos_data = {"entryValue": matched_level.price}
+                    tracker.handle_position_close(
+                        pos_data, 
+                        levels,
+                        current_price
+                    )
+
+    def _on_touch_placed(self, placed: int) -> None:
+        """Touch-Orders aus dem Task platziert → Hedge wie im synchronen Pfad prüfen"""
+        try:
+            self._update_and_hedge("entry_on_touch")
+        except Exception as e:
+            self._on_update_error(e)
+
+    def _on_update_error(self, error: Exception) -> None:
+        """Fehler im Tick-Update → loggen und Grid in ERROR setzen"""
+        self.logger.error(f"Update-Fehler: {error}")
+        self.lifecycle.set_state(GridState.ERROR, str(error))
             
+    def _place_initial_orders(self, levels: List[GridLevel], current_price: float) -> None:
+        """
+        Initial-Placement: Live im laufenden Loop parallel als Task,
+        sonst (Dry-Run / kein Loop) sequentiell
+        """
+        if not self._dry_run:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                self._initial_orders_task = self._track_task(
+                    self._place_initial_orders_async(levels, current_price)
+                )
+                return
+        
+        self.order_executor.place_initial_grid_orders(levels, current_price)
+        self._update_and_hedge("initial_orders")
+
+    async def _place_initial_orders_async(self, levels: List[GridLevel], current_price: float) -> None:
+        """Paralleles Initial-Placement, danach Hedge aktualisieren"""
+        try:
+            await self.order_executor.place_initial_grid_orders_async(levels, current_price)
+            self._update_and_hedge("initial_orders")
+        except Exception as e:
+            self.logger.error(f"❌ Initial-Placement fehlgeschlagen: {e}")
+            self._initial_orders_task = None  # nächster Tick versucht es erneut
+
     # ========================================
     # Rebalancing
     # ========================================
 
-    def _maybe_rebalance(self) -> None:
-        """Rebalancing"""
-        now = time.time()
-        interval = int(self.grid_conf.rebalance_interval)
-        if now - self.last_rebalance < interval:
+    def _maybe_rebalance(self, now: float) -> None:
+        """Rebalancing (now = Tick-Zeit aus update())"""
+        if now < self._next_rebalance_at:
+            return
+        
+        # Touch-Orders noch unterwegs → Levels nicht anfassen, nächster Tick
+        if self.order_executor.touch_in_flight:
+            return
+        
+        # Ordergröße: gecacht, nur bei geänderter Basisgröße/Fee-Config neu
+        if self.risk_manager.refresh_effective_size():
+            self.order_sync.size = self.risk_manager.effective_size
+        
+        # Grid-Config unverändert → Preisraster und Levels bleiben gültig
+        if self.calculator.config_key() == self._last_cfg_key:
+            self._mark_rebalanced(now)
             return
         
         self.calculator.invalidate_cache()
+        self.risk_manager.parse_config()
+        
+        # Häufigster Fall: gleiches Raster → Levels behalten, nur TP/SL neu
+        if self._rebalance_in_place():
+            self._mark_rebalanced(now)
+            return
         
+        # Key: (Preis in Ticks, Seiten-Bits) – Integer-Hashing statt Float/String
+        tick = float(self.grid_conf.min_price_step)
         old_levels = {
-            (lvl.price, lvl.side): {
+            (round(lvl.price / tick), lvl.side_bits): {
                 'active': lvl.active,
                 'filled': lvl.filled,
                 'position_open': lvl.position_open,
@@ -350,14 +554,9 @@ class GridManager:
         
         self._create_grid_levels()
         
-        price_list = self.calculator.calculate_price_list()
+        self._apply_tp_sl()
         for lvl in self.levels:
-            lvl.tp = self.risk_manager.calculate_take_profit(
-                lvl.price, lvl.index, lvl.side, price_list
-            )
-            lvl.sl = self.risk_manager.calculate_stop_loss(lvl.price, lvl.side)
-            
-            key = (lvl.price, lvl.side)
+            key = (round(lvl.price / tick), lvl.side_bits)
             if key in old_levels:
                 old = old_levels[key]
                 lvl.active = old['active']
@@ -370,11 +569,51 @@ class GridManager:
                 if not lvl.sl and old['sl']:
                     lvl.sl = old['sl']
         
+        self._validate_levels()
+        
         # ✅ FIX: PositionTracker mit neuen Levels aktualisieren
         if hasattr(self, 'position_tracker'):
-            self.position_tracker.set_levels(self.levels)
+            self._attach_levels()
         
+        self._mark_rebalanced(now)
+
+    def _mark_rebalanced(self, now: float) -> None:
+        """Rebalance-Zeitpunkt merken und nächste Deadline setzen (ein Vergleich pro Tick)"""
         self.last_rebalance = now
+        self._next_rebalance_at = now + self._rebalance_interval
+
+    def _rebalance_in_place(self) -> bool:
+        """
+        Rebalance ohne Level-Neuaufbau, wenn Preise und Seiten gleich bleiben
+        
+        Vergleich per Index (Raster ist tick-gerundet → exakter Vergleich);
+        kein Dict über (float, str)-Keys, Level-Objekte (order_id,
+        position_id, Status) und LevelBook bleiben erhalten.
+        
+        Returns:
+            True wenn in-place aktualisiert, False → voller Neuaufbau nötig
+        """
+        new_prices = self.calculator.calculate_price_list()
+        if new_prices != self._price_list:
+            return False
+        
+        levels = self.levels
+        sides = self._level_sides(new_prices)
+        if len(levels) != len(sides) or any(lvl.side != s for lvl, s in zip(levels, sides)):
+            return False
+        
+        self._refresh_price_cache()
+        
+        old_tp_sl = [(lvl.tp, lvl.sl) for lvl in levels]
+        self._apply_tp_sl()
+        for lvl, (old_tp, old_sl) in zip(levels, old_tp_sl):
+            if not lvl.tp and old_tp:
+                lvl.tp = old_tp
+            if not lvl.sl and old_sl:
+                lvl.sl = old_sl
+        
+        self._validate_levels()
+        return True
 
     # ========================================
     # Hedge Management
@@ -387,25 +626,20 @@ class GridManager:
         GEÄNDERT: Nur noch Trigger-Check, kein preemptive hedge
         """
         # Live-Preis holen
-        current_price = getattr(self.hedge_manager, "live_price", None)
+        current_price = self.hedge_manager.live_price
         if not current_price:
             return
         
-        # Grid-Bounds berechnen
-        price_list = self.calculator.calculate_price_list()
-        lower_bound = price_list[0]
-        upper_bound = price_list[-1]
-        step = abs(price_list[1] - price_list[0]) if len(price_list) > 1 else 0
-
         # Net-Position für Hedge-Size
         net_pos = self.position_tracker.get_net_position()
         
         # Trigger prüfen - macht intern Market Order wenn Preis außerhalb
+        # (Grid-Bounds aus Cache)
         self.hedge_manager.check_trigger(
             price=current_price,
-            lower_bound=lower_bound,
-            upper_bound=upper_bound,
-            step=step,
+            lower_bound=self._lower_bound,
+            upper_bound=self._upper_bound,
+            step=self._step,
             net_position=net_pos
         )
 
@@ -450,13 +684,20 @@ class GridManager:
                 self.virtual_manager.print_stats()
             
             # ✅ Tasks canceln
+            self._prune_tasks()
             if self._pending_tasks:
                 self.logger.info("🧹 Cleanup: Cancelling pending tasks...")
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    self._track_task(self._cancel_all_tasks())
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    # Kein laufender Loop → Tasks hängen an einem beendeten Loop
+                    # und lassen sich nicht mehr awaiten, nur noch abbrechen
+                    for task in self._pending_tasks:
+                        if not task.done():
+                            task.cancel()
+                    self._pending_tasks.clear()
                 else:
-                    loop.run_until_complete(self._cancel_all_tasks())
+                    self._track_task(self._cancel_all_tasks())
             
             self.lifecycle.set_state(GridState.CLOSED)
             self.logger.info(f"[{self.symbol}] Grid geschlossen")
@@ -477,6 +718,7 @@ class GridManager:
         """Cleanup mit Task-Tracking"""
         self.logger.debug(f"[{self.symbol}] Cleanup")
         
+        self._prune_tasks()
         if self._pending_tasks:
             self.logger.warning(f"⚠️ {len(self._pending_tasks)} Tasks noch aktiv")
 
@@ -493,41 +735,36 @@ class GridManager:
         - Aktuelle Qty (basierend auf Net-Position)
         - SL-Preis (ein Grid über/unter Bound)
         - Status: ⏸️ = bereit aber inaktiv, 🛡️ = aktiv
+        
+        Bei Log-Level über INFO entfällt alles (auch der Hedge-Text).
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        # Zähler inkrementell aus dem LevelBook statt Scan über alle Levels
+        book = self.position_tracker.book
         total = len(self.levels)
-        active = sum(1 for l in self.levels if l.active)
-        filled = sum(1 for l in self.levels if l.filled)
+        active = book.n_active
+        filled = book.n_filled
         
         # Hedge-Status aufbauen (wenn enabled)
-        if getattr(self.hedge_manager.config, "enabled", False):
-            # Grid-Bounds holen
-            price_list = self.calculator.calculate_price_list()
-            lower_bound = price_list[0]
-            upper_bound = price_list[-1]
-            step = abs(price_list[1] - price_list[0]) if len(price_list) > 1 else 0
-            
-            # Net Position für Qty-Berechnung (LIVE)
+        hm = self.hedge_manager
+        if hm.config.enabled:
+            # Net Position für Qty-Berechnung (LIVE), Grid-Bounds aus Cache
             net_pos = self.position_tracker.get_net_position()
             
-            # Hedge-Parameter berechnen (IMMER aktuell)
-            if self.grid_direction == "long":
-                hedge_price = lower_bound - step
-                sl_price = hedge_price + (2 * step)  # Ein Grid ÜBER lower_bound
+            # Hedge-Parameter berechnen (IMMER aktuell), SL ein Grid über/unter Bound
+            side, hedge_price, sl_price = hedge_target(
+                self.grid_direction, self._lower_bound, self._upper_bound, self._step
+            )
+            if side is not None:
                 # Qty: Net-Position oder base_size als Fallback
                 hedge_qty = abs(net_pos) if abs(net_pos) > 0.001 else self.grid_conf.base_order_size
-                
-            elif self.grid_direction == "short":
-                hedge_price = upper_bound + step
-                sl_price = hedge_price - (2 * step)  # Ein Grid UNTER upper_bound
-                hedge_qty = abs(net_pos) if abs(net_pos) > 0.001 else self.grid_conf.base_order_size
             else:
-                hedge_price = None
-                sl_price = None
                 hedge_qty = 0
             
             # Status-Symbol
-            hedge_active = getattr(self.hedge_manager, "active", False)
-            symbol = "🛡️" if hedge_active else "⏸️"
+            symbol = "🛡️" if hm.active else "⏸️"
             
             # Display-String mit ALLEN Infos
             if hedge_price and sl_price and hedge_qty > 0:
@@ -546,50 +783,61 @@ class GridManager:
         
         # State-Check für Throttling (nur loggen wenn was geändert hat)
         current_state = (active, filled, hedge_status)
-        last_state = getattr(self, "_last_status_log", None)
-        
-        if current_state == last_state:
+        if current_state == self._last_status_log:
             return
         
         self._last_status_log = current_state
         
         # Output
-        if self.trading.dry_run and self.virtual_manager:
-            stats = self.virtual_manager.get_stats()
-            self.logger.info(
-                f"💰 {self.symbol} @ {current_price:.4f} | "
-                f"Active: {active}/{total} | Filled: {filled} | "
-                f"Hedge: {hedge_status} | "
-                f"PnL: {stats['total_pnl']:+.2f} USDT ({stats['win_rate']:.0f}% WR)"
+        logger = self.logger
+        vm = self.virtual_manager
+        if self._dry_run and vm:
+            stats = vm.get_stats()
+            logger.info(
+                "💰 %s @ %.4f | Active: %d/%d | Filled: %d | Hedge: %s | "
+                "PnL: %+.2f USDT (%.0f%% WR)",
+                self.symbol, current_price, active, total, filled, hedge_status,
+                stats['total_pnl'], stats['win_rate']
             )
         else:
-            self.logger.info(
-                f"💰 {self.symbol} @ {current_price:.4f} | "
-                f"Active: {active}/{total} | Filled: {filled} | "
-                f"Hedge: {hedge_status}"
+            logger.info(
+                "💰 %s @ %.4f | Active: %d/%d | Filled: %d | Hedge: %s",
+                self.symbol, current_price, active, total, filled, hedge_status
             )
 
-    def log_summary(self) -> None:
-        """Summary"""
-        self.logger.info("=" * 60)
-        self.logger.info(
-            f"GRID SUMMARY ({self.symbol}) "
-            f"{'🛡️ === DRY-RUN === 🛡️' if self.trading.dry_run else '⚠️ === REAL MODE === ⚠️'}"
-        )
-        self.logger.info("=" * 60)
-        self.logger.info(f"Direction        : {self.grid_direction.upper()}")
-        self.logger.info(f"Margin Mode      : {self.margin_mode.upper()}")
-        self.logger.info(f"Leverage         : {self.leverage}")
-        self.logger.info(f"Mode             : {self.grid_conf.grid_mode.value}")
-        self.logger.info(
+    def _build_summary_lines(self) -> List[str]:
+        """Baut die statischen Summary-Zeilen (ändern sich zur Laufzeit nicht)"""
+        separator = "=" * 60
+        mode_label = '🛡️ === DRY-RUN === 🛡️' if self.trading.dry_run else '⚠️ === REAL MODE === ⚠️'
+        
+        lines = [
+            separator,
+            f"GRID SUMMARY ({self.symbol}) {mode_label}",
+            separator,
+            f"Direction        : {self.grid_direction.upper()}",
+            f"Margin Mode      : {self.margin_mode.upper()}",
+            f"Leverage         : {self.leverage}",
+            f"Mode             : {self.grid_conf.grid_mode.value}",
             f"Levels           : {len(self.levels)} "
-            f"({self.grid_conf.lower_price} → {self.grid_conf.upper_price})"
-        )
-        self.logger.info(f"Base Size        : {self.grid_conf.base_order_size}")
-        self.logger.info(f"Active ReOrder   : {self.grid_conf.active_reorder}")
+            f"({self.grid_conf.lower_price} → {self.grid_conf.upper_price})",
+            f"Base Size        : {self.grid_conf.base_order_size}",
+            f"Active ReOrder   : {self.grid_conf.active_reorder}",
+        ]
+        # ✅ FIX: ReOrder Distance nur wenn aktiv (reorder_steps war sonst undefiniert)
         if self.grid_conf.active_reorder:
             reorder_steps = getattr(self.grid_conf, 'reorder_distance_steps', 2)
-        self.logger.info(f"ReOrder Distance : {reorder_steps} Grid-Steps")
+            lines.append(f"ReOrder Distance : {reorder_steps} Grid-Steps")
+        
+        return lines
+
+    def log_summary(self) -> None:
+        """Summary (statische Zeilen vorberechnet, Risk-Info dynamisch)"""
+        logger = self.logger
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        for line in self._summary_lines:
+            logger.info(line)
         
         try:
             risk_info = self.risk_manager.get_risk_summary()
@@ -610,7 +858,7 @@ class GridManager:
         except Exception as e:
             self.logger.warning(f"⚠️ Risk-Summary fehlt: {e}")
         
-        self.logger.info("=" * 60)
+        logger.info(self._summary_lines[0])
 
     # ========================================
     # External Interfaces
@@ -621,16 +869,18 @@ class GridManager:
         if dry_run is None:
             dry_run = self.trading.dry_run
         
+        # Lock nur für den Snapshot, nicht über die HTTP-Roundtrips hinweg
         async with self._levels_lock:
-            result = await self.order_sync.sync_orders(dry_run=dry_run)
+            levels = tuple(self.levels)
         
-        return result
+        return await self.order_sync.sync_orders(dry_run=dry_run, levels=levels)
 
     def attach_account_sync(self, account_sync):
         """Verbindet AccountSync"""
         self.account_sync = account_sync
         account_sync.grid_manager = self
-        self.order_sync.fetch_orders_callback = lambda: list(account_sync.orders.values())
+        # Tuple-Snapshot: schützt match_orders vor Mutation durch WS-Events
+        self.order_sync.fetch_orders_callback = account_sync.snapshot_orders
 
     def setup_margin(self):
         """Margin-Mode & Leverage setzen"""
@@ -666,6 +916,10 @@ class GridManager:
         """Delegiert an PositionTracker"""
         self.position_tracker.handle_order_cancel(level)
     
+    def find_level(self, price: float, tolerance: float, state_mask: int = 0) -> Optional[GridLevel]:
+        """Erstes Level nahe price (Binary Search im LevelBook)"""
+        return self.position_tracker.book.find_near(price, tolerance, state_mask)
+    
     def handle_error(self, error: Exception):
         """Error-Handler"""
         msg = f"{type(error).__name__}: {error}"
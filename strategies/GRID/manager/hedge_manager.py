@@ -12,8 +12,36 @@ CHANGES:
 
 import logging
 import time
-from typing import Optional
+from typing import Optional, Tuple
 from utils.exceptions import OrderPlacementError, InsufficientBalanceError
+from utils.constants import HEDGE_WARN_MIN_INTERVAL
+from models.grid_level import SIDE_BUY, SIDE_SELL, count_risk_levels
+
+
+def hedge_target(
+    grid_direction: str,
+    lower_bound: float,
+    upper_bound: float,
+    step: float,
+    offset: float = 1.0
+) -> Tuple[Optional[str], Optional[float], Optional[float]]:
+    """
+    Hedge-Seite, Hedge-Preis und SL für eine Grid-Richtung (ohne Seiteneffekte)
+    
+    LONG:  SELL @ lower - step·offset, SL zwei Steps darüber
+    SHORT: BUY  @ upper + step·offset, SL zwei Steps darunter
+    
+    Returns:
+        (side, hedge_price, sl_price) – (None, None, None) bei "both"
+    """
+    if grid_direction == "long":
+        hedge_price = lower_bound - step * offset
+        return "SELL", hedge_price, hedge_price + (2 * step)
+    if grid_direction == "short":
+        hedge_price = upper_bound + step * offset
+        return "BUY", hedge_price, hedge_price - (2 * step)
+    return None, None, None
+
 
 class HedgeManager:
     def __init__(self, config, api_client, symbol, logger=None, dry_run=False, client_pub=None):
@@ -38,6 +66,23 @@ class HedgeManager:
         self.current_hedge_price = None
         self.current_hedge_size = 0
         self.current_sl_price = None
+        
+        # Log-Throttling (update_preemptive_hedge)
+        self._last_hedge_log = None
+        
+        # Warn-Limiter: gleiche Warnung höchstens alle HEDGE_WARN_MIN_INTERVAL s
+        self._hedge_warn_key = None
+        self._hedge_warn_last_ts = float("-inf")
+
+    # ----------------------------------------------------------------
+    def _warn_limited(self, key: tuple, msg: str, *args) -> None:
+        """Warnung nur bei neuem Key oder nach Ablauf des Mindestintervalls"""
+        now = time.monotonic()
+        if key == self._hedge_warn_key and now - self._hedge_warn_last_ts < HEDGE_WARN_MIN_INTERVAL:
+            return
+        self._hedge_warn_key = key
+        self._hedge_warn_last_ts = now
+        self.logger.warning(msg, *args)
 
     # ----------------------------------------------------------------
     def check_trigger(self, price: float, lower_bound: float, upper_bound: float, 
@@ -45,28 +90,30 @@ class HedgeManager:
         """
         Prüft ob Preis Grid-Range verlässt → Trigger
         """
+        config = self.config
+        
         # Hedge disabled
-        if not getattr(self.config, "enabled", False):
+        if not config.enabled:
             return
 
         # Trigger-Distanz berechnen
-        trigger_offset = getattr(self.config, "trigger_offset", 1.0)
+        trigger_offset = config.trigger_offset
         trigger_distance = step * trigger_offset
         lower_trigger_price = lower_bound - trigger_distance
         upper_trigger_price = upper_bound + trigger_distance
 
         # Unterhalb Range
         if price <= lower_trigger_price:
-            self.logger.debug(f"[HEDGE] 📉 Trigger unterhalb Range @ {price:.4f}")
+            self.logger.debug("[HEDGE] 📉 Trigger unterhalb Range @ %.4f", price)
             self.trigger("below", price, step, lower_bound, upper_bound, net_position=net_position)
 
         # Oberhalb Range
         elif price >= upper_trigger_price:
-            self.logger.debug(f"[HEDGE] 📈 Trigger oberhalb Range @ {price:.4f}")
+            self.logger.debug("[HEDGE] 📈 Trigger oberhalb Range @ %.4f", price)
             self.trigger("above", price, step, lower_bound, upper_bound, net_position=net_position)
 
         # Wieder in Range → Close
-        elif self.active and getattr(self.config, "close_on_reentry", False):
+        elif self.active and config.close_on_reentry:
             if lower_bound <= price <= upper_bound:
                 self.close()
 
@@ -82,27 +129,22 @@ class HedgeManager:
 
         # Config laden
         grid_mode = getattr(self.config, "grid_direction", "long")
-        mode = getattr(self.config, "mode", "direct")
-        offset = getattr(self.config, "trigger_offset", 1.0)
+        mode = self.config.mode
+        offset = self.config.trigger_offset
 
         # Hedge-Richtung & Preis bestimmen (nur für Logging/SL-Berechnung)
-        if grid_mode == "long" and direction == "below":
-            hedge_side = "SELL"
-            hedge_price = lower_bound - (step * offset)
-        elif grid_mode == "short" and direction == "above":
-            hedge_side = "BUY"
-            hedge_price = upper_bound + (step * offset)
-        else:
+        hedge_side, hedge_price, _ = hedge_target(grid_mode, lower_bound, upper_bound, step, offset)
+        if hedge_side is None or (direction == "below") != (hedge_side == "SELL"):
             return
 
-        self.logger.info(f"[HEDGE] ⚡ Hedge {hedge_side} @ Market | Net={net_position:.2f}")
+        self.logger.info("[HEDGE] ⚡ Hedge %s @ Market | Net=%.2f", hedge_side, net_position)
 
         # Modi
         if mode == "direct":
             self.place_order(hedge_side, hedge_price, self.get_size(net_position=net_position))
 
         elif mode == "dynamic":
-            partials = getattr(self.config, "partial_levels", [0.5, 0.75, 1.0])
+            partials = self.config.partial_levels
             for lvl in partials:
                 offset_price = hedge_price - (step * lvl) if hedge_side == "SELL" else hedge_price + (step * lvl)
                 self.place_order(hedge_side, offset_price, self.get_size(net_position=net_position, fraction=lvl))
@@ -121,8 +163,8 @@ class HedgeManager:
         - fixed: Nutzt feste Ratio
         - net_position: Nutzt aktuelle Position
         """
-        size_mode = getattr(self.config, "size_mode", "net_position")
-        fixed_ratio = getattr(self.config, "fixed_size_ratio", 0.5)
+        size_mode = self.config.size_mode
+        fixed_ratio = self.config.fixed_size_ratio
         
         if size_mode == "fixed":
             return fixed_ratio * fraction * multiplier
@@ -136,7 +178,7 @@ class HedgeManager:
         Platziert MARKET Hedge-Order mit Stop-Loss
         """
         if size <= 0:
-            self.logger.warning("[HEDGE] ❌ Ungültige Hedge-Größe (0)")
+            self._warn_limited(("size", side), "[HEDGE] ❌ Ungültige Hedge-Größe (0)")
             return
 
         # Client ID generieren
@@ -144,8 +186,8 @@ class HedgeManager:
         
         # Dry-Run
         if self.dry_run:
-            sl_str = f" | SL={sl_price:.4f}" if sl_price else ""
-            self.logger.info(f"[HEDGE] (Dry) Market {side} Qty={size:.1f}{sl_str}")
+            sl_str = " | SL=%.4f" % sl_price if sl_price else ""
+            self.logger.info("[HEDGE] (Dry) Market %s Qty=%.1f%s", side, size, sl_str)
             
             self.hedge_client_id = client_id  # Speichern
             self.current_hedge_price = reference_price
@@ -181,10 +223,11 @@ class HedgeManager:
             self.current_sl_price = sl_price
             self.active = True
             
-            sl_info = f" | SL={sl_price:.4f}" if sl_price else ""
-            self.logger.info(
-                f"[HEDGE] ✅ Market Order → ID={order_id} ClientID={client_id}{sl_info}"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                sl_info = " | SL=%.4f" % sl_price if sl_price else ""
+                self.logger.info(
+                    "[HEDGE] ✅ Market Order → ID=%s ClientID=%s%s", order_id, client_id, sl_info
+                )
         
         except OrderPlacementError as e:
             self.logger.error(f"[HEDGE] ❌ Order-Placement-Fehler: {e}")
@@ -241,57 +284,34 @@ class HedgeManager:
         Risiko = Offene Orders unter/über Preis + Gefüllte ohne TP
         """
         # Hedge disabled
-        if not getattr(self.config, "enabled", False):
+        if not self.config.enabled:
             return
-        if not getattr(self.config, "preemptive_hedge", False):
+        if not self.config.preemptive_hedge:
             return
         
         # Daten prüfen
         if not (lower_bound and upper_bound and step and current_price and grid_levels):
-            self.logger.warning("[HEDGE] ⚠️ Unvollständige Daten")
+            self._warn_limited(("data",), "[HEDGE] ⚠️ Unvollständige Daten")
             return
 
         grid_mode = getattr(self.config, "grid_direction", "long")
         
-        # Risiko berechnen + SL
+        # Risiko = Orders unter (long) bzw. über (short) Preis + Gefüllte ohne TP
+        # (vektorisiert über die LevelBook-Spalten)
         if grid_mode == "long":
-            active_orders_below = [
-                lvl for lvl in grid_levels 
-                if lvl.active and lvl.price < current_price and lvl.side == "BUY"
-            ]
-            
-            filled_without_tp = [
-                lvl for lvl in grid_levels 
-                if lvl.position_open or lvl.filled
-            ]
-            
-            risk_count = len(active_orders_below) + len(filled_without_tp)
-            hedge_side = "SELL"
-            hedge_price = lower_bound - step
-            sl_price = hedge_price + (2 * step)  # SL ÜBER Hedge
-            
+            risk_count = count_risk_levels(grid_levels, current_price, SIDE_BUY)
         elif grid_mode == "short":
-            active_orders_above = [
-                lvl for lvl in grid_levels 
-                if lvl.active and lvl.price > current_price and lvl.side == "SELL"
-            ]
-            
-            filled_without_tp = [
-                lvl for lvl in grid_levels 
-                if lvl.position_open or lvl.filled
-            ]
-            
-            risk_count = len(active_orders_above) + len(filled_without_tp)
-            hedge_side = "BUY"
-            hedge_price = upper_bound + step
-            sl_price = hedge_price - (2 * step)  # SL UNTER Hedge
+            risk_count = count_risk_levels(grid_levels, current_price, SIDE_SELL)
         else:
             return
         
+        # SL ÜBER (long) bzw. UNTER (short) dem Hedge
+        hedge_side, hedge_price, sl_price = hedge_target(grid_mode, lower_bound, upper_bound, step)
+        
         target_qty = risk_count * base_size
         
         # Logging
-        last_logged_state = getattr(self, "_last_hedge_log", None)
+        last_logged_state = self._last_hedge_log
         current_state = (risk_count, target_qty)
 
         if current_state != last_logged_state:
@@ -306,14 +326,14 @@ class HedgeManager:
             return
         
         # Hedge existiert → MODIFY
-        if self.active and hasattr(self, "hedge_order_id"):
-            current_qty = getattr(self, "current_hedge_size", 0)
+        if self.active:
+            current_qty = self.current_hedge_size
             
             if current_qty > 0:
                 deviation = abs(target_qty - current_qty) / current_qty
                 
                 if deviation > 0.05:  # 5% Schwelle
-                    self.logger.info(f"[HEDGE] 🔄 Modify Qty: {current_qty:.2f} → {target_qty:.2f}")
+                    self.logger.info("[HEDGE] 🔄 Modify Qty: %.2f → %.2f", current_qty, target_qty)
                     
                     if not dry_run:
                         try:
@@ -324,7 +344,7 @@ class HedgeManager:
                             )
                             self.current_hedge_size = target_qty
                             self.current_sl_price = sl_price
-                            self.logger.info(f"[HEDGE] ✅ Qty + SL angepasst (SL={sl_price:.4f})")
+                            self.logger.info("[HEDGE] ✅ Qty + SL angepasst (SL=%.4f)", sl_price)
                         except Exception as e:
                             self.logger.error(f"[HEDGE] ❌ Modify failed: {e}")
                             # Fallback: Close + neu platzieren
@@ -366,8 +386,7 @@ class HedgeManager:
             self.active = True
             
             self.logger.info(
-                f"[HEDGE] ✅ Market Order ID={self.hedge_order_id} | "
-                f"SL={sl_price:.4f}"
+                "[HEDGE] ✅ Market Order ID=%s | SL=%.4f", self.hedge_order_id, sl_price
             )
         except Exception as e:
             self.logger.error(f"[HEDGE] ❌ Fehler: {e}")
\ No newline at end of file
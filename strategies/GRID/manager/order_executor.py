@@ -9,33 +9,23 @@ Zuständig für:
 - Integration mit VirtualOrderManager
 """
 
+import asyncio
 import logging
 import time
 from typing import List, Optional
-from dataclasses import dataclass
 
 import sys
 from pathlib import Path
 GRID_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(GRID_DIR))
 
-from utils.exceptions import OrderPlacementError
-from utils.constants import GRID_ORDER_MIN_DISTANCE_STEPS
-
-
-@dataclass
-class GridLevel:
-    """Grid-Level Definition (sollte eigentlich zentral sein)"""
-    index: int
-    price: float
-    side: str
-    order_id: Optional[str] = None
-    active: bool = False
-    filled: bool = False
-    position_open: bool = False
-    position_id: Optional[str] = None
-    tp: Optional[float] = None
-    sl: Optional[float] = None
+from utils.exceptions import OrderPlacementError, GridInitializationError
+from utils.constants import (
+    GRID_ORDER_MIN_DISTANCE_STEPS, INITIAL_ORDER_CONCURRENCY, BATCH_ORDER_MAX_SIZE
+)
+from models.grid_level import (
+    GridLevel, LevelBook, LEVEL_BUSY, SIDE_BUY, SIDE_SELL, DIR_LONG, DIR_SHORT, DIRECTION_BITS
+)
 
 
 class OrderExecutor:
@@ -79,14 +69,108 @@ class OrderExecutor:
         
         # Tracking
         self._initial_orders_placed = False
+        
+        # Pro Session konstant → einmal auflösen statt pro Order
+        self._client_id_prefix = f"{trading_config.client_id_prefix}_{symbol}_"
+        self._virtual = virtual_manager if trading_config.dry_run else None
+        self._reorder_steps = grid_config.reorder_distance_steps
+        
+        # Konstante Order-Parameter (Live + Batch) einmal aufbauen, pro Order
+        # werden nur Seite/Preis/Größe/TP/SL/Client-ID ergänzt
+        self._order_template = dict(
+            symbol=symbol,
+            order_type="LIMIT",
+            trade_side="OPEN",
+            tp_stop_type="MARK_PRICE",
+            sl_stop_type="MARK_PRICE",
+        )
+        self._batch_template = {
+            "orderType": "LIMIT",
+            "tradeSide": "OPEN",
+            "effect": "GTC",
+            "reduceOnly": False,
+            "tpStopType": "MARK_PRICE",
+            "slStopType": "MARK_PRICE",
+        }
+        
+        # Batch-Endpoint (falls Client ihn anbietet) für Initial-Placement
+        self._place_batch = getattr(client, "place_orders_batch", None)
+        
+        # Task-Runner des GridManagers (_track_task): Live-Touch-Orders laufen
+        # dann nicht-blockierend im Event-Loop; None → synchron
+        self.task_runner = None
+        # Callback(placed) nach erfolgreichem Task-Placement (Hedge-Update)
+        self.on_touch_placed = None
+        # Laufende Touch-Tasks – solange > 0 darf kein Rebalance die Levels ersetzen
+        self.touch_in_flight = 0
+        
+        # Richtung ist nach Konstruktion fix → Bitmaske + Flags einmal auflösen
+        self._dir_bits = DIRECTION_BITS.get(grid_direction, 0)
+        self._allow_long = bool(self._dir_bits & DIR_LONG)
+        self._allow_short = bool(self._dir_bits & DIR_SHORT)
+        
+        # Entry-on-Touch: LevelBook (SoA) + Scan
+        self._levels: List[GridLevel] = []
+        self.set_levels(self._levels)
+        self._touch_scan = self._make_touch_scan()
 
     # =========================================================================
     # Initial Order Placement
     # =========================================================================
 
+    def _select_initial_levels(
+        self,
+        levels: List[GridLevel],
+        current_price: Optional[float]
+    ) -> tuple:
+        """
+        Filtert die Levels für das Initial-Placement vor
+        
+        Returns:
+            (eligible, skipped_count) – eligible in Platzierungs-Reihenfolge
+        """
+        dir_bits = self._dir_bits
+        
+        # ✅ Bei SHORT: Von oben nach unten loggen (umgekehrte Reihenfolge)
+        levels_to_process = reversed(levels) if self.grid_direction == "short" else levels
+        
+        # === Richtung prüfen ===
+        candidates = [
+            lvl for lvl in levels_to_process
+            if not lvl.state & LEVEL_BUSY
+            and (lvl.side_bits & dir_bits or not lvl.side_bits)
+        ]
+        
+        # === Preis-Validierung (nur wenn Preis bekannt) ===
+        if current_price is None:
+            return candidates, 0
+        
+        eligible = [
+            lvl for lvl in candidates
+            if not (lvl.side_bits & SIDE_BUY and lvl.price >= current_price)
+            and not (lvl.side_bits & SIDE_SELL and lvl.price <= current_price)
+        ]
+        return eligible, len(candidates) - len(eligible)
+
+    def _log_initial_summary(
+        self,
+        placed_count: int,
+        total: int,
+        skipped_count: int,
+        current_price: Optional[float]
+    ) -> None:
+        """Abschluss-Log für das Initial-Placement"""
+        mode = "Dry-Run" if self.trading.dry_run else "Real"
+        price_str = "@ Preis %.4f" % current_price if current_price else "(kein Preis)"
+        
+        self.logger.info(
+            "[ORDER]   %d/%d Grid-Orders platziert, %d übersprungen %s (%s)",
+            placed_count, total, skipped_count, price_str, mode
+        )
+
     def place_initial_grid_orders(self, levels: List[GridLevel], current_price: Optional[float] = None) -> int:
         """
-        Platziert alle Grid-Orders initial
+        Platziert alle Grid-Orders initial (sequentiell)
         
         Args:
             levels: Liste von GridLevel-Objekten
@@ -99,50 +183,107 @@ class OrderExecutor:
             self.logger.warning("Initial Orders bereits platziert")
             return 0
         
-        allow_long = self.grid_direction in ("long", "both")
-        allow_short = self.grid_direction in ("short", "both")
-        
+        eligible, skipped_count = self._select_initial_levels(levels, current_price)
         placed_count = 0
-        skipped_count = 0
         
-        # ✅ Bei SHORT: Von oben nach unten loggen (umgekehrte Reihenfolge)
-        levels_to_process = reversed(levels) if self.grid_direction == "short" else levels
-        #levels_to_process = reversed(levels)
+        if self._place_batch is not None and not self.trading.dry_run:
+            # Live: ein Request pro BATCH_ORDER_MAX_SIZE Orders statt einer pro Level
+            for chunk in self._build_batch_chunks(eligible):
+                placed_count += self._submit_batch(chunk)
+        else:
+            for lvl in eligible:
+                try:
+                    self.place_entry_order(lvl)
+                    placed_count += 1
+                    
+                except Exception as e:
+                    self.logger.error(f"❌ Initial Order @ {lvl.price} fehlgeschlagen: {e}")
         
-        for lvl in levels_to_process:
-            if lvl.active or lvl.filled:
-                continue
-            
-            # === Richtung prüfen ===
-            if lvl.side == "BUY" and not allow_long:
-                continue
-            if lvl.side == "SELL" and not allow_short:
-                continue
-            
-            # === Preis-Validierung (nur wenn Preis bekannt) ===
-            if current_price is not None:
-                if lvl.side == "BUY" and lvl.price >= current_price:
-                    skipped_count += 1
-                    continue
-                if lvl.side == "SELL" and lvl.price <= current_price:
-                    skipped_count += 1
-                    continue
+        self._log_initial_summary(placed_count, len(levels), skipped_count, current_price)
+        
+        self._initial_orders_placed = True
+        return placed_count
+
+    async def place_initial_grid_orders_async(
+        self,
+        levels: List[GridLevel],
+        current_price: Optional[float] = None
+    ) -> int:
+        """
+        Platziert alle Grid-Orders initial – REST-Calls parallel
+        
+        Der sync Client blockiert pro Request einen kompletten Roundtrip. Hier
+        laufen die Calls via asyncio.to_thread überlappend. Bietet der Client
+        einen Batch-Endpoint, gehen bis zu BATCH_ORDER_MAX_SIZE Orders in einen
+        Request, sonst Einzel-Orders (begrenzt durch INITIAL_ORDER_CONCURRENCY
+        wegen API-Rate-Limits). Dry-Run bleibt sequentiell, da Virtual Orders
+        keine Netzwerk-Latenz haben.
+        
+        Args:
+            levels: Liste von GridLevel-Objekten
+            current_price: Aktueller Marktpreis (optional)
+        
+        Returns:
+            Anzahl platzierter Orders
+        """
+        if self.trading.dry_run:
+            return self.place_initial_grid_orders(levels, current_price)
+        
+        if self._initial_orders_placed:
+            self.logger.warning("Initial Orders bereits platziert")
+            return 0
+        
+        eligible, skipped_count = self._select_initial_levels(levels, current_price)
+        
+        # Gleiche Obergrenze für Batch- und Einzel-Requests (Rate-Limit + Keep-Alive-Pool)
+        semaphore = asyncio.Semaphore(INITIAL_ORDER_CONCURRENCY)
+        
+        if self._place_batch is not None:
+            # Batch-Endpoint: wenige Requests, die ebenfalls parallel laufen
+            async def submit(chunk: list) -> int:
+                # Nur der HTTP-Request im Thread, Level/LevelBook-Update im Loop
+                async with semaphore:
+                    result = await asyncio.to_thread(self._send_batch, chunk)
+                return len(self._apply_batch_result(chunk, result, "Initial Order"))
             
-            try:
-                self.place_entry_order(lvl)
-                placed_count += 1
-                
-            except Exception as e:
-                self.logger.error(f"❌ Initial Order @ {lvl.price} fehlgeschlagen: {e}")
+            results = await asyncio.gather(*(
+                submit(chunk) for chunk in self._build_batch_chunks(eligible)
+            ))
+            placed_count = sum(results)
+            self._log_initial_summary(placed_count, len(levels), skipped_count, current_price)
+            self._initial_orders_placed = True
+            return placed_count
         
-        mode = "Dry-Run" if self.trading.dry_run else "Real"
-        price_str = f"@ Preis {current_price:.4f}" if current_price else "(kein Preis)"
+        # Checks wie place_entry_order, aber vorab im Loop
+        size = self.risk_manager.effective_size
+        if size <= 0:
+            self.logger.warning("❌ Effektive Ordergröße 0 → Skip")
+            eligible = []
         
-        self.logger.info(
-            f"[ORDER]   {placed_count}/{len(levels)} Grid-Orders platziert, "
-            f"{skipped_count} übersprungen {price_str} ({mode})"
+        async def place(lvl: GridLevel) -> bool:
+            if not lvl.valid:
+                self.logger.error(f"❌ TP/SL-Validierung fehlgeschlagen @ {lvl.price}")
+                return False
+            # Nur der HTTP-Request im Thread, Level/LevelBook-Update im Loop
+            async with semaphore:
+                order_id = await asyncio.to_thread(self._send_entry, lvl, size)
+            self._mark_real_order(lvl, order_id)
+            return True
+        
+        results = await asyncio.gather(
+            *(place(lvl) for lvl in eligible),
+            return_exceptions=True
         )
         
+        placed_count = 0
+        for lvl, result in zip(eligible, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"❌ Initial Order @ {lvl.price} fehlgeschlagen: {result}")
+            elif result:
+                placed_count += 1
+        
+        self._log_initial_summary(placed_count, len(levels), skipped_count, current_price)
+        
         self._initial_orders_placed = True
         return placed_count
 
@@ -150,50 +291,188 @@ class OrderExecutor:
     # Entry-on-Touch Logic
     # =========================================================================
 
-    def check_new_grid_orders(self, levels: List[GridLevel], current_price: float) -> int:
-        """Platziert Orders bei Preis-Touch (Entry-on-Touch)"""
+    def check_new_grid_orders(
+        self,
+        levels: List[GridLevel],
+        current_price: float,
+        step: Optional[float] = None
+    ) -> int:
+        """
+        Platziert Orders bei Preis-Touch (Entry-on-Touch)
+        
+        Args:
+            levels: Liste von GridLevel-Objekten
+            current_price: Aktueller Marktpreis
+            step: Gecachter Grid-Step (sonst aus Preisraster berechnet)
         
-        allow_long = self.grid_direction in ("long", "both")
-        allow_short = self.grid_direction in ("short", "both")
+        Raises:
+            GridInitializationError: Levels nicht über set_levels() angebunden
+        """
+        # Levels müssen am geteilten LevelBook hängen (GridManager._attach_levels) –
+        # ein eigenes Book würde lvl.book vom PositionTracker wegbiegen
+        if levels is not self._levels:
+            raise GridInitializationError(
+                "Entry-on-Touch: Levels nicht mit dem geteilten LevelBook verbunden"
+            )
         
         # Mindestabstand berechnen
-        price_list = self.calculator.calculate_price_list()
-        if len(price_list) < 2:
+        if step is None:
+            price_list = self.calculator.calculate_price_list()
+            if len(price_list) < 2:
+                return 0
+            step = abs(price_list[1] - price_list[0])
+        elif step <= 0:
             return 0
         
-        min_distance = abs(price_list[1] - price_list[0])
+        min_distance = step
         
-        # ✅ FIX: Nutze reorder_distance_steps für Entry-on-Touch
-        reorder_steps = getattr(self.grid_conf, 'reorder_distance_steps', 2)
-        reorder_distance = min_distance * reorder_steps
+        # ✅ FIX: Nutze reorder_distance_steps für Entry-on-Touch (einmal in __init__ gelesen)
+        reorder_distance = min_distance * self._reorder_steps
         
-        placed_count = 0
+        return self._touch_scan(current_price, reorder_distance)
+
+    def set_levels(self, levels: List[GridLevel], book: Optional[LevelBook] = None) -> None:
+        """
+        Setzt Levels + LevelBook (SoA-Spalten) für Entry-on-Touch
         
-        for lvl in levels:
-            if lvl.active or lvl.filled or lvl.position_open:
-                continue
+        Wird bei Init und nach jedem Rebalance aufgerufen (Levels werden
+        dort komplett ersetzt, nie in-place verändert).
+        
+        Args:
+            levels: Liste von GridLevel-Objekten
+            book: Geteiltes LevelBook (sonst wird eines aufgebaut)
+        """
+        self._levels = levels
+        self._book = book if book is not None else LevelBook(levels)
 
-            if lvl.side == "BUY" and allow_long:
-                # BUY: Order platzieren wenn Preis genug ÜBER Level
-                required_price = lvl.price + reorder_distance
-                if current_price >= required_price:
-                    try:
-                        self.place_entry_order(lvl)
-                        placed_count += 1
-                    except Exception as e:
-                        self.logger.error(f"❌ Entry-Order @ {lvl.price} failed: {e}")
+    def _make_touch_scan(self):
+        """
+        Wählt die Entry-on-Touch-Schleife passend zur Grid-Richtung
+        
+        Die Richtungs-Prüfung wird einmalig hier aufgelöst statt pro
+        Level und Tick in der Schleife. Solange der Preis keinen der
+        gecachten Trigger-Preise kreuzt, endet der Scan nach zwei Vergleichen.
+        Sonst läuft die Abstands-/Status-Prüfung vektorisiert über die
+        LevelBook-Spalten, Python iteriert nur über die berührten Levels.
+        Berührt ein Tick im Live-Modus mehrere Levels und bietet der Client
+        einen Batch-Endpoint, gehen sie gesammelt raus (_place_touch_batch).
+        
+        Returns:
+            scan(current_price, reorder_distance) -> Anzahl platzierter Orders
+            (0 wenn als Task gestartet – dann meldet on_touch_placed)
+        """
+        place = self._place_touch_entry
+        live = self._virtual is None
+        dispatch = self._dispatch_touch
+        place_batch = self._place_touch_batch if (
+            live and self._place_batch is not None
+        ) else None
+        allow_long = self._allow_long
+        allow_short = self._allow_short
+
+        def scan(current_price, reorder_distance):
+            book = self._book
+            # Kein Trigger-Preis gekreuzt → nichts zu tun (häufigster Tick)
+            buy_trigger, sell_trigger = book.touch_bounds(reorder_distance, allow_long, allow_short)
+            if sell_trigger < current_price < buy_trigger:
+                return 0
             
-            elif lvl.side == "SELL" and allow_short:
-                # SELL: Order platzieren wenn Preis genug UNTER Level
-                required_price = lvl.price - reorder_distance
-                if current_price <= required_price:
+            levels = self._levels
+            touched = book.touched_indices(
+                current_price, reorder_distance, allow_long, allow_short
+            )
+            # tolist(): Python-ints statt NumPy-Skalare als Listen-Index
+            touched = touched.tolist()
+            # Als Task gestartet → Anzahl meldet erst der Task (on_touch_placed)
+            if live and touched and dispatch([levels[i] for i in touched]):
+                return 0
+            if place_batch is not None and len(touched) > 1:
+                return place_batch([levels[i] for i in touched])
+            placed_count = 0
+            for i in touched:
+                placed_count += place(levels[i])
+            return placed_count
+
+        return scan
+
+    def _place_touch_entry(self, lvl: GridLevel) -> int:
+        """Platziert Entry-Order für ein berührtes Level (1 = versucht, 0 = Fehler)"""
+        try:
+            self.place_entry_order(lvl)
+            return 1
+        except Exception as e:
+            self.logger.error(f"❌ Entry-Order @ {lvl.price} failed: {e}")
+            return 0
+
+    def _place_touch_batch(self, levels: List[GridLevel]) -> int:
+        """
+        Entry-on-Touch für mehrere Levels eines Ticks über den Batch-Endpoint
+        
+        Ein Request je BATCH_ORDER_MAX_SIZE Orders statt ein Roundtrip pro
+        Level; Checks und Level-Update wie beim Initial-Batch.
+        
+        Returns:
+            Anzahl platzierter Orders
+        """
+        return sum(
+            self._submit_batch(chunk, "Entry-Order")
+            for chunk in self._build_batch_chunks(levels)
+        )
+
+    def _dispatch_touch(self, levels: List[GridLevel]) -> bool:
+        """
+        Startet Live-Touch-Orders als Task (Levels vorab aktiv, touch_in_flight + 1)
+        
+        Returns:
+            True wenn als Task gestartet, False → synchron platzieren
+        """
+        runner = self.task_runner
+        if runner is None:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        
+        for lvl in levels:
+            lvl.active = True
+        self.touch_in_flight += 1
+        runner(self._place_touch_async(levels))
+        return True
+
+    async def _place_touch_async(self, levels: List[GridLevel]) -> None:
+        """Platziert Touch-Orders, gibt Fehlschläge frei und senkt touch_in_flight wieder"""
+        placed = set()
+        try:
+            if self._place_batch is not None and len(levels) > 1:
+                for chunk in self._build_batch_chunks(levels):
+                    result = await asyncio.to_thread(self._send_batch, chunk)
+                    placed.update(map(id, self._apply_batch_result(chunk, result, "Entry-Order")))
+            elif self.risk_manager.effective_size <= 0:
+                self.logger.warning("❌ Effektive Ordergröße 0 → Skip")
+            else:
+                size = self.risk_manager.effective_size
+                for lvl in levels:
+                    if not lvl.valid:
+                        self.logger.error(f"❌ TP/SL-Validierung fehlgeschlagen @ {lvl.price}")
+                        continue
                     try:
-                        self.place_entry_order(lvl)
-                        placed_count += 1
+                        order_id = await asyncio.to_thread(self._send_entry, lvl, size)
                     except Exception as e:
                         self.logger.error(f"❌ Entry-Order @ {lvl.price} failed: {e}")
-                
-        return placed_count
+                        continue
+                    self._mark_real_order(lvl, order_id)
+                    placed.add(id(lvl))
+        finally:
+            # Nicht platzierte Levels wieder freigeben (auch bei Cancel)
+            for lvl in levels:
+                if id(lvl) not in placed:
+                    lvl.active = False
+            self.touch_in_flight -= 1
+        
+        callback = self.on_touch_placed
+        if placed and callback is not None:
+            callback(len(placed))
 
     # =========================================================================
     # Order Placement (Core)
@@ -209,83 +488,202 @@ class OrderExecutor:
         Raises:
             OrderPlacementError: Bei Fehler
         """
-        # Ordergröße berechnen
-        size = self.risk_manager.calculate_effective_size()
+        logger = self.logger
+        price = level.price
+        side = level.side
+        
+        # Ordergröße (gecacht im RiskManager)
+        size = self.risk_manager.effective_size
         if size <= 0:
-            self.logger.warning("❌ Effektive Ordergröße 0 → Skip")
+            logger.warning("❌ Effektive Ordergröße 0 → Skip")
             return
 
         # TP/SL holen
         tp, sl = level.tp, level.sl
         
-        # Validierung
-        if not self.risk_manager.validate_tp_sl(level.price, tp, sl, level.side):
-            self.logger.error(f"❌ TP/SL-Validierung fehlgeschlagen @ {level.price}")
+        # Validierung (vorberechnet bei Grid-Aufbau/Rebalance)
+        if not level.valid:
+            logger.error(f"❌ TP/SL-Validierung fehlgeschlagen @ {price}")
             return
 
+        client_id = f"{self._client_id_prefix}{level.index}"
+
         # === Virtual Order (Dry-Run) ===
-        if self.trading.dry_run and self.virtual_manager:
-            order_id = self.virtual_manager.place_order(
-                side=level.side,
+        virtual = self._virtual
+        if virtual is not None:
+            order_id = virtual.place_order(
+                side=side,
                 order_type="LIMIT",
                 qty=size,
-                price=level.price,
+                price=price,
                 tp_price=tp,
                 sl_price=sl,
-                client_id=f"{self.trading.client_id_prefix}_{self.symbol}_{level.index}"
+                client_id=client_id
             )
             
-            level.order_id = order_id
+            level.set_order(order_id)
             level.active = True
-            level.tp, level.sl = tp, sl
             
-            # Log mit Formatierung
-            tp_str = f"{tp:.4f}" if tp else "None"
-            sl_str = f"{sl:.4f}" if sl else "None"
-            
-            self.logger.info(
-                f"[VIRTUAL] 🟢 Limit Order {level.side} @ {level.price:.4f} | "
-                f"size={size} | TP={tp_str} | SL={sl_str} aktiviert"
-            )
+            # Log mit Formatierung (nur wenn INFO aktiv)
+            if logger.isEnabledFor(logging.INFO):
+                tp_str = "%.4f" % tp if tp else "None"
+                sl_str = "%.4f" % sl if sl else "None"
+                logger.info(
+                    "[VIRTUAL] 🟢 Limit Order %s @ %.4f | size=%s | TP=%s | SL=%s aktiviert",
+                    side, price, size, tp_str, sl_str
+                )
             return
 
         # === Echte Order ===
+        self._mark_real_order(level, self._send_entry(level, size))
+
+    def _send_entry(self, level: GridLevel, size: float) -> Optional[str]:
+        """
+        REST-Request für eine Live-Entry-Order (ohne Level-Update, thread-tauglich)
+        
+        Returns:
+            Order-ID
+        
+        Raises:
+            OrderPlacementError: Bei Fehler
+        """
+        price = level.price
         try:
             result = self.client.place_order(
-                symbol=self.symbol,
+                **self._order_template,
                 side=level.side,
-                order_type="LIMIT",
                 qty=size,
-                price=level.price,
-                trade_side="OPEN",
-                tp_price=tp,
-                sl_price=sl,
-                tp_stop_type="MARK_PRICE",
-                sl_stop_type="MARK_PRICE",
-                client_id=f"{self.trading.client_id_prefix}_{self.symbol}_{level.index}"
+                price=price,
+                tp_price=level.tp,
+                sl_price=level.sl,
+                client_id=f"{self._client_id_prefix}{level.index}"
             )
+        except Exception as e:
+            raise OrderPlacementError(f"Order @ {price} fehlgeschlagen: {e}")
+        
+        # Order-ID extrahieren
+        if isinstance(result, dict):
+            return result.get("orderId")
+        return str(result)
 
-            # Order-ID extrahieren
-            if isinstance(result, dict):
-                order_id = result.get("orderId")
-            else:
-                order_id = str(result)
-            
-            level.order_id = order_id
-            level.active = True
-            level.tp = tp
-            level.sl = sl
-            
-            tp_str = f"{tp:.4f}" if tp else "None"
-            sl_str = f"{sl:.4f}" if sl else "None"
+    def _mark_real_order(self, level: GridLevel, order_id: Optional[str]) -> None:
+        """Überträgt eine platzierte Live-Order auf das Level und loggt sie"""
+        level.set_order(order_id)
+        level.active = True
+        
+        logger = self.logger
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        tp, sl = level.tp, level.sl
+        tp_str = "%.4f" % tp if tp else "None"
+        sl_str = "%.4f" % sl if sl else "None"
+        
+        logger.info(
+            "[REAL] 🟢 %s @ %.4f → ID=%s | TP=%s | SL=%s",
+            level.side, level.price, order_id, tp_str, sl_str
+        )
+
+    # =========================================================================
+    # Batch Placement (Live)
+    # =========================================================================
+
+    def _build_batch_chunks(self, levels: List[GridLevel]) -> List[list]:
+        """
+        Baut API-Order-Dicts für den Batch-Endpoint (gleiche Checks wie
+        place_entry_order) und teilt sie in Requests à BATCH_ORDER_MAX_SIZE
+        
+        Returns:
+            Liste von Chunks, je Chunk Liste von (level, order_dict)
+        """
+        size = self.risk_manager.effective_size
+        if size <= 0:
+            self.logger.warning("❌ Effektive Ordergröße 0 → Skip")
+            return []
+        
+        client_id_prefix = self._client_id_prefix
+        template = self._batch_template
+        entries = []
+        
+        for lvl in levels:
+            if not lvl.valid:
+                self.logger.error(f"❌ TP/SL-Validierung fehlgeschlagen @ {lvl.price}")
+                continue
             
-            self.logger.info(
-                f"[REAL] 🟢 {level.side} @ {level.price:.4f} → ID={order_id} | "
-                f"TP={tp_str} | SL={sl_str}"
-            )
+            order = {
+                **template,
+                "side": lvl.side,
+                "qty": size,
+                "price": lvl.price,
+                "clientId": f"{client_id_prefix}{lvl.index}",
+            }
+            if lvl.tp is not None:
+                order["tpPrice"] = lvl.tp
+            if lvl.sl is not None:
+                order["slPrice"] = lvl.sl
+            entries.append((lvl, order))
+        
+        return [
+            entries[i:i + BATCH_ORDER_MAX_SIZE]
+            for i in range(0, len(entries), BATCH_ORDER_MAX_SIZE)
+        ]
+
+    def _submit_batch(self, chunk: list, label: str = "Initial Order") -> int:
+        """
+        Sendet einen Batch-Request und überträgt die Order-IDs auf die Levels
+        
+        Args:
+            chunk: Liste von (level, order_dict)
+            label: Bezeichnung für Fehler-Logs je Order
+        
+        Returns:
+            Anzahl erfolgreich platzierter Orders
+        """
+        return len(self._apply_batch_result(chunk, self._send_batch(chunk), label))
 
+    def _send_batch(self, chunk: list) -> Optional[dict]:
+        """Batch-REST-Request (ohne Level-Update, thread-tauglich) – None bei Fehler"""
+        try:
+            result = self._place_batch(
+                symbol=self.symbol,
+                order_list=[order for _, order in chunk]
+            )
         except Exception as e:
-            raise OrderPlacementError(f"Order @ {level.price} fehlgeschlagen: {e}")
+            self.logger.error(f"❌ Batch-Order ({len(chunk)} Orders) fehlgeschlagen: {e}")
+            return None
+        
+        if not isinstance(result, dict):
+            self.logger.error(f"❌ Batch-Order: unerwartete Antwort {result!r}")
+            return None
+        return result
+
+    def _apply_batch_result(self, chunk: list, result: Optional[dict], label: str) -> List[GridLevel]:
+        """
+        Überträgt die Order-IDs einer Batch-Antwort auf die Levels
+        
+        Returns:
+            Erfolgreich platzierte Levels
+        """
+        if result is None:
+            return []
+        
+        by_client_id = {order["clientId"]: lvl for lvl, order in chunk}
+        placed = []
+        for item in result.get("successList", []):
+            lvl = by_client_id.get(item.get("clientId"))
+            if lvl is None:
+                continue
+            self._mark_real_order(lvl, item.get("orderId"))
+            placed.append(lvl)
+        
+        for item in result.get("failureList", []):
+            lvl = by_client_id.get(item.get("clientId"))
+            price = lvl.price if lvl is not None else item.get("clientId")
+            self.logger.error(
+                f"❌ {label} @ {price} fehlgeschlagen: {item.get('errorMsg', 'Unknown')}"
+            )
+        
+        return placed
 
     # =========================================================================
     # Validation & Helpers
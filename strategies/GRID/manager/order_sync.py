@@ -11,23 +11,48 @@ GRID_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(GRID_DIR))
 from utils.constants import PRICE_TOLERANCE
 from utils.exceptions import OrderSyncError, OrderPlacementError, OrderCancellationError
+from models.grid_level import SIDE_BUY, SIDE_SELL
 
 
 class OrderSync:
     """Synchronisiert erwartete Grid-Orders mit echten Orders am Exchange"""
 
     def __init__(self, symbol, levels, logger: logging.Logger, client=None, size: float = None, 
-                 grid_direction: str = "both", cancel_obsolete: bool = False):
+                 grid_direction: str = "both", cancel_obsolete: bool = False, price_list: tuple = ()):
         self.symbol = symbol
         self.levels = levels
+        self.price_list: tuple = ()
+        self._grid_prices: tuple = ()
+        self.set_levels(levels, price_list)
         self.logger = logging.getLogger("OrderSync")
         self.client = client
         self.size = size or 0.0
         self.grid_direction = grid_direction
+        # Richtung ist fix → gesperrte Seite einmal als Bitmaske auflösen
+        self._blocked_sides = {"long": SIDE_SELL, "short": SIDE_BUY}.get(grid_direction, 0)
         self.fetch_orders_callback = None
         self._sync_lock = asyncio.Lock()
         self.cancel_obsolete = cancel_obsolete
 
+    def set_levels(self, levels, price_list: tuple = ()) -> None:
+        """
+        Übernimmt Levels + gemeinsames Preisraster (Referenz aus GridManager)
+        
+        Die gerundeten, sortierten Grid-Preise werden einmal hier statt bei
+        jedem Sync für die Obsolete-Prüfung aufgebaut.
+        """
+        self.levels = levels
+        self.price_list = price_list
+        self._grid_prices = tuple(sorted(round(p, 8) for p in price_list))
+
+    def _is_grid_price(self, price: float) -> bool:
+        """Binary Search: liegt price (innerhalb Toleranz) auf dem Grid?"""
+        grid_prices = self._grid_prices
+        idx = bisect.bisect_left(grid_prices, price)
+        if idx < len(grid_prices) and abs(grid_prices[idx] - price) < PRICE_TOLERANCE:
+            return True
+        return idx > 0 and abs(grid_prices[idx - 1] - price) < PRICE_TOLERANCE
+
     async def fetch_exchange_orders(self):
         """Holt offene Orders über Callback oder HTTP-Fallback"""
         if self.fetch_orders_callback:
@@ -38,12 +63,15 @@ class OrderSync:
                 return []
         return []
 
-    def match_orders(self, exchange_orders):
+    def match_orders(self, exchange_orders, levels=None):
         """
         ✅ OPTIMIERT: Binary Search für O(n log n)
         
         Vergleicht Exchange-Orders mit Grid-Levels
+        (levels: optionaler Snapshot, sonst self.levels)
         """
+        if levels is None:
+            levels = self.levels
         matched, missing, obsolete = [], [], []
         
         # ========================================
@@ -64,7 +92,7 @@ class OrderSync:
         # ========================================
         # STEP 2: Match Levels mit Binary Search
         # ========================================
-        for lvl in self.levels:
+        for lvl in levels:
             if not lvl.active and not lvl.filled:
                 rounded_level_price = round(lvl.price, 8)
                 
@@ -90,7 +118,7 @@ class OrderSync:
                 
                 # Ergebnis speichern
                 if matched_order:
-                    lvl.order_id = matched_order.get("orderId")
+                    lvl.set_order(matched_order.get("orderId"))
                     lvl.active = True
                     matched.append(lvl)
                 else:
@@ -99,37 +127,50 @@ class OrderSync:
         # ========================================
         # STEP 3: Obsolete Orders finden
         # ========================================
-        level_prices = {round(l.price, 8) for l in self.levels}
-        
-        for price in order_prices:
-            if price not in level_prices:
-                # Toleranz-Check
-                is_in_grid = any(
-                    abs(price - lp) < PRICE_TOLERANCE 
-                    for lp in level_prices
-                )
-                if not is_in_grid:
+        if self._grid_prices:
+            # Gemeinsames Preisraster → Binary Search statt Vollscan
+            for price in order_prices:
+                if not self._is_grid_price(price):
                     obsolete.append(price_to_order[price])
+        else:
+            level_prices = {round(l.price, 8) for l in levels}
+            
+            for price in order_prices:
+                if price not in level_prices:
+                    # Toleranz-Check
+                    is_in_grid = any(
+                        abs(price - lp) < PRICE_TOLERANCE 
+                        for lp in level_prices
+                    )
+                    if not is_in_grid:
+                        obsolete.append(price_to_order[price])
         
         return matched, missing, obsolete
 
-    async def sync_orders(self, dry_run: bool = True):
-        """Führt Synchronisation durch"""
+    async def sync_orders(self, dry_run: bool = True, levels=None):
+        """
+        Führt Synchronisation durch
+        
+        Args:
+            dry_run: Nur zählen, keine Orders setzen/löschen
+            levels: Optionaler Level-Snapshot (sonst self.levels)
+        """
         async with self._sync_lock:
             try:
                 exchange_orders = await self.fetch_exchange_orders()
-                matched, missing, obsolete = self.match_orders(exchange_orders)
+                matched, missing, obsolete = self.match_orders(exchange_orders, levels)
                 
                 self.logger.info(
-                    f"MATCHED={len(matched)} | MISSING={len(missing)} | OBSOLETE={len(obsolete)}"
+                    "MATCHED=%d | MISSING=%d | OBSOLETE=%d", len(matched), len(missing), len(obsolete)
                 )
                 
                 if dry_run:
                     self.logger.info("Dry-Run aktiv")
-                    for lvl in missing:
-                        self.logger.debug(f"[DryRun] Order @ {lvl.price}")
-                    for o in obsolete:
-                        self.logger.debug(f"[DryRun] Cancel ID={o.get('orderId')}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        for lvl in missing:
+                            self.logger.debug("[DryRun] Order @ %s", lvl.price)
+                        for o in obsolete:
+                            self.logger.debug("[DryRun] Cancel ID=%s", o.get('orderId'))
                     return {
                         "matched": len(matched),
                         "missing": len(missing),
@@ -139,11 +180,10 @@ class OrderSync:
                 
                 # Real-Mode: Fehlende Orders setzen
                 placed_count = 0
+                blocked_sides = self._blocked_sides
                 for lvl in missing:
                     try:
-                        if self.grid_direction == "long" and lvl.side == "SELL":
-                            continue
-                        if self.grid_direction == "short" and lvl.side == "BUY":
+                        if lvl.side_bits & blocked_sides:
                             continue
                         
                         client_id = f"GRID_{lvl.index}_{int(time.time())}"
@@ -167,13 +207,13 @@ class OrderSync:
                         if sl_price:
                             params["sl_price"] = sl_price
                         
-                        self.logger.info(f"🟢 Order @ {lvl.price} | {lvl.side} | TP={tp_price} | SL={sl_price}")
+                        self.logger.info("🟢 Order @ %s | %s | TP=%s | SL=%s", lvl.price, lvl.side, tp_price, sl_price)
                         
                         result = self.client.place_order(**params)
-                        lvl.order_id = result.get("orderId") if isinstance(result, dict) else str(result)
+                        lvl.set_order(result.get("orderId") if isinstance(result, dict) else str(result))
                         lvl.active = True
                         placed_count += 1
-                        self.logger.info(f"✅ Order ID={lvl.order_id}")
+                        self.logger.info("✅ Order ID=%s", lvl.order_id)
                         
                     except Exception as e:
                         raise OrderPlacementError(f"Order @ {lvl.price} fehlgeschlagen: {e}")
@@ -184,7 +224,7 @@ class OrderSync:
                     for o in obsolete:
                         try:
                             order_id = o.get("orderId")
-                            self.logger.info(f"🗑️ Cancel ID={order_id}")
+                            self.logger.info("🗑️ Cancel ID=%s", order_id)
                             
                             cancel_result = self.client.cancel_orders(
                                 symbol=self.symbol,
@@ -194,7 +234,7 @@ class OrderSync:
                             success_list = cancel_result.get("successList", [])
                             if success_list:
                                 cancelled_count += 1
-                                self.logger.info(f"✅ Cancelled ID={order_id}")
+                                self.logger.info("✅ Cancelled ID=%s", order_id)
                             else:
                                 failure_list = cancel_result.get("failureList", [])
                                 if failure_list:
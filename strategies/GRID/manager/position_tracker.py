@@ -12,27 +12,15 @@ Zuständig für:
 
 import logging
 from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass
 
 import sys
 from pathlib import Path
 GRID_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(GRID_DIR))
 
-
-@dataclass
-class GridLevel:
-    """Grid-Level Definition (sollte eigentlich zentral sein)"""
-    index: int
-    price: float
-    side: str
-    order_id: Optional[str] = None
-    active: bool = False
-    filled: bool = False
-    position_open: bool = False
-    position_id: Optional[str] = None
-    tp: Optional[float] = None
-    sl: Optional[float] = None
+from models.grid_level import (
+    GridLevel, LevelBook, LEVEL_POSITION, SIDE_BUY, SIDE_SELL, count_risk_levels
+)
 
 
 class PositionTracker:
@@ -68,21 +56,26 @@ class PositionTracker:
         # Net-Position Tracking
         self.net_position_size = 0.0
         self._levels: List[GridLevel] = []  # ✅ NEU: Levels-Storage
+        self.book = LevelBook()  # Inkrementelle Active/Filled/Net-Zähler
         
         # Stats
         self.total_fills = 0
         self.total_closes = 0
         self.total_cancels = 0
 
-    def set_levels(self, levels: List[GridLevel]) -> None:
+    def set_levels(self, levels: List[GridLevel], book: Optional[LevelBook] = None) -> None:
         """
         Setzt/Aktualisiert die Grid-Levels
         
         Args:
             levels: Liste von GridLevel-Objekten
+            book: Geteiltes LevelBook (sonst wird eines aufgebaut)
         """
         self._levels = levels
-        self.logger.debug(f"Levels aktualisiert: {len(levels)} Levels")
+        self.book = book if book is not None else LevelBook(levels)
+        # Läuft bei jedem Rebalance → f-String nur bauen wenn DEBUG aktiv
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Levels aktualisiert: %d Levels", len(levels))
 
     # =========================================================================
     # Fill-Handling
@@ -104,9 +97,8 @@ class PositionTracker:
             self.total_fills += 1
             
             self.logger.info(
-                f"💰 {self.symbol} "
-                f"🎯 Grid #{level.index} @ {level.price:.4f} FILLED "
-                f"→ Position OPEN (warte auf TP/SL)"
+                "💰 %s 🎯 Grid #%d @ %.4f FILLED → Position OPEN (warte auf TP/SL)",
+                self.symbol, level.index, level.price
             )
             
             # Net-Position updaten
@@ -144,16 +136,19 @@ class PositionTracker:
             # Entry-Preis aus Position-Daten
             entry_value = float(position_data.get("entryValue", 0))
             
-            # Finde passendes Level
-            matched_level = None
-            for lvl in levels:
-                if lvl.position_open and abs(lvl.price - entry_value) < 0.001:
-                    matched_level = lvl
-                    break
+            # Finde passendes Level (Binary Search im LevelBook)
+            if levels is self._levels:
+                matched_level = self.book.find_near(entry_value, 0.001, LEVEL_POSITION)
+            else:
+                matched_level = None
+                for lvl in levels:
+                    if lvl.position_open and abs(lvl.price - entry_value) < 0.001:
+                        matched_level = lvl
+                        break
             
             if not matched_level:
                 self.logger.warning(
-                    f"⚠️ Keine offene Grid-Position für Entry {entry_value:.4f}"
+                    "⚠️ Keine offene Grid-Position für Entry %.4f", entry_value
                 )
                 return
             
@@ -190,44 +185,45 @@ class PositionTracker:
                             # Log bei ungültigen Werten
                             if reorder_steps != reorder_steps_raw:
                                 self.logger.warning(
-                                    f"⚠️ reorder_distance_steps={reorder_steps_raw} ungültig, "
-                                    f"verwende {reorder_steps}"
+                                    "⚠️ reorder_distance_steps=%s ungültig, verwende %d",
+                                    reorder_steps_raw, reorder_steps
                                 )
                             
                             # BUY: ReOrder wenn Preis ÜBER Entry (folgt TP-Richtung nach oben)
-                            if matched_level.side == "BUY":
+                            if matched_level.side_bits & SIDE_BUY:
                                 required_price = matched_level.price + (min_distance * reorder_steps)
                                 should_reorder = current_price > required_price
 
                             # SELL: ReOrder wenn Preis UNTER Entry (folgt TP-Richtung nach unten)
-                            elif matched_level.side == "SELL":
+                            elif matched_level.side_bits & SIDE_SELL:
                                 required_price = matched_level.price - (min_distance * reorder_steps)
                                 should_reorder = current_price < required_price
 
 
                             if required_price is not None:
                                 self.logger.info(
-                                    f"💰 {self.symbol} ✅ Grid #{matched_level.index} @ {matched_level.price:.4f} " 
-                                    f"Position geschlossen (TP/SL). Grid wir freigegeben wenn Preis {required_price:.4f} erreicht"
+                                    "💰 %s ✅ Grid #%d @ %.4f Position geschlossen (TP/SL). "
+                                    "Grid wir freigegeben wenn Preis %.4f erreicht",
+                                    self.symbol, matched_level.index, matched_level.price, required_price
                                 )
                             
                             # ✅ FIX: Nur loggen wenn required_price existiert
-                            if not should_reorder and required_price is not None:
+                            if not should_reorder and required_price is not None and self.logger.isEnabledFor(logging.DEBUG):
                                 self.logger.debug(
-                                    f"🔄 ReOrder @ {matched_level.price:.4f} wartet auf "
-                                    f"{reorder_steps} Steps Abstand "
-                                    f"(aktuell {current_price:.4f}, benötigt {required_price:.4f})"
+                                    "🔄 ReOrder @ %.4f wartet auf %d Steps Abstand "
+                                    "(aktuell %.4f, benötigt %.4f)",
+                                    matched_level.price, reorder_steps, current_price, required_price
                                 )
                 else:
                     # Kein Preis bekannt → Entry-on-Touch übernimmt
                     should_reorder = False
                     self.logger.debug(
-                        f"🔄 ReOrder @ {matched_level.price:.4f} wird von Entry-on-Touch gehandelt"
+                        "🔄 ReOrder @ %.4f wird von Entry-on-Touch gehandelt", matched_level.price
                     )
                 
                 # Nur platzieren wenn Preis weit genug weg
                 if should_reorder:
-                    self.logger.debug(f"🔄 ReOrder @ {matched_level.price:.4f}")
+                    self.logger.debug("🔄 ReOrder @ %.4f", matched_level.price)
                     
                     # Kurze Pause damit Position vollständig geschlossen ist
                     import time
@@ -269,7 +265,7 @@ class PositionTracker:
             
             self.total_cancels += 1
             
-            self.logger.info(f"🔴 Level #{level.index} cancelled @ {level.price}")
+            self.logger.info("🔴 Level #%d cancelled @ %s", level.index, level.price)
             
             # Net-Position updaten
             self.update_net_position()
@@ -298,40 +294,20 @@ class PositionTracker:
         Returns:
             Aktuelle Net-Position
         """
-        if levels is not None:
+        if levels is not None and levels is not self._levels:
             self._levels = levels
+            self.book = LevelBook(levels)
         
         if not self._levels:
             # ✅ FIX: Nur Debug statt Warning
             self.logger.debug("⚠️ Keine Levels für Net-Position-Berechnung")
             return 0.0
         
-        # Zähle gefüllte Long/Short
-        long_filled = sum(
-            1 for lvl in self._levels 
-            if lvl.filled and lvl.side == "BUY"
-        )
-        short_filled = sum(
-            1 for lvl in self._levels 
-            if lvl.filled and lvl.side == "SELL"
-        )
-        
-        # Zähle aktive (pending) Long/Short
-        long_pending = sum(
-            1 for lvl in self._levels 
-            if lvl.active and not lvl.filled and lvl.side == "BUY"
-        )
-        short_pending = sum(
-            1 for lvl in self._levels 
-            if lvl.active and not lvl.filled and lvl.side == "SELL"
-        )
-        
         # Berechne Net
-        base_size = self.risk_manager.calculate_effective_size()
+        base_size = self.risk_manager.effective_size
         
-        self.net_position_size = (
-            (long_filled - short_filled + long_pending - short_pending) * base_size
-        )
+        # Net = (Long filled + pending) - (Short filled + pending), O(1) aus LevelBook
+        self.net_position_size = self.book.net_levels * base_size
         
         return self.net_position_size
 
@@ -362,31 +338,11 @@ class PositionTracker:
         """
         if grid_direction == "long":
             # LONG: Risiko = Orders UNTER Preis + Filled ohne TP
-            active_below = sum(
-                1 for lvl in levels 
-                if lvl.active and lvl.price < current_price and lvl.side == "BUY"
-            )
-            
-            filled_without_tp = sum(
-                1 for lvl in levels 
-                if lvl.position_open or lvl.filled
-            )
-            
-            return active_below + filled_without_tp
+            return count_risk_levels(levels, current_price, SIDE_BUY)
         
         elif grid_direction == "short":
             # SHORT: Risiko = Orders ÜBER Preis + Filled ohne TP
-            active_above = sum(
-                1 for lvl in levels 
-                if lvl.active and lvl.price > current_price and lvl.side == "SELL"
-            )
-            
-            filled_without_tp = sum(
-                1 for lvl in levels 
-                if lvl.position_open or lvl.filled
-            )
-            
-            return active_above + filled_without_tp
+            return count_risk_levels(levels, current_price, SIDE_SELL)
         
         else:  # both
             return 0
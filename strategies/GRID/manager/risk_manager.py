@@ -8,7 +8,9 @@ Zuständig für:
 """
 
 import logging
-from typing import Optional, List
+from typing import Optional, List, Tuple
+
+import numpy as np
 from models.config_models import TPMode, SLMode, GridDirection
 
 
@@ -29,6 +31,29 @@ class RiskManager:
         self.risk_conf = risk_config
         self.calculator = grid_calculator
         self.logger = logger or logging.getLogger("RiskManager")
+        
+        # TP/SL-Parameter typisiert (einmal geparst, neu per parse_config)
+        self._tp_mode = None
+        self._tp_pct: float = 0.0
+        self._sl_mode = None
+        self._sl_pct: float = 0.0
+        self._sl_fixed: Optional[float] = None
+        self.parse_config()
+        
+        # Effektive Ordergröße hängt nur von der Config ab → einmal berechnen,
+        # neu nur wenn sich die Eingangsgrößen ändern (refresh_effective_size)
+        self._size_key: tuple = self._size_inputs()
+        self.effective_size: float = self._compute_effective_size(None)
+
+    def parse_config(self) -> None:
+        """TP/SL-Config einmal in typisierte Attribute übernehmen (nach Config-Änderung erneut aufrufen)"""
+        gc = self.grid_conf
+        self._tp_mode = gc.tp_mode
+        self._tp_pct = float(gc.take_profit_pct) / 100.0
+        self._sl_mode = gc.sl_mode
+        self._sl_pct = float(gc.stop_loss_pct) / 100
+        fixed = gc.stop_loss_price
+        self._sl_fixed = float(fixed) if fixed is not None else None
 
     # =========================================================================
     # Fee-Berechnung
@@ -44,6 +69,43 @@ class RiskManager:
         Returns:
             Effektive Größe nach Abzug doppelter Gebühr (Entry + Exit)
         """
+        if base_size is None:
+            return self.effective_size
+        return self._compute_effective_size(base_size)
+
+    def invalidate_effective_size(self) -> float:
+        """Berechnet die gecachte effektive Größe neu (nach Config-Änderung)"""
+        self._size_key = self._size_inputs()
+        self.effective_size = self._compute_effective_size(None)
+        return self.effective_size
+
+    def refresh_effective_size(self) -> bool:
+        """
+        Effektive Größe nur neu berechnen, wenn sich Basisgröße oder
+        Fee-Config geändert haben
+        
+        Returns:
+            True wenn sich die Eingangsgrößen geändert haben
+        """
+        key = self._size_inputs()
+        if key == self._size_key:
+            return False
+        self.invalidate_effective_size()
+        return True
+
+    def _size_inputs(self) -> tuple:
+        """Eingangsgrößen der effektiven Ordergröße (Cache-Key)"""
+        rc = self.risk_conf
+        return (
+            self.grid_conf.base_order_size,
+            rc.include_fees,
+            rc.fee_side,
+            rc.maker_fee_pct,
+            rc.taker_fee_pct,
+        )
+
+    def _compute_effective_size(self, base_size: Optional[float]) -> float:
+        """Eigentliche Fee-Berechnung (ohne Cache)"""
         if base_size is None:
             base_size = float(self.grid_conf.base_order_size)
         
@@ -68,10 +130,8 @@ class RiskManager:
         size = base_size * (1.0 - effective_fee)
         
         self.logger.debug(
-            f"[FeeCalc] base={base_size:.4f} | "
-            f"fee_side={fee_side} | "
-            f"fee={fee_pct:.6f} × 2 = {effective_fee:.6f} | "
-            f"effective={size:.8f}"
+            "[FeeCalc] base=%.4f | fee_side=%s | fee=%.6f × 2 = %.6f | effective=%.8f",
+            base_size, fee_side, fee_pct, effective_fee, size
         )
         
         return max(0.0, round(size, 8))
@@ -107,7 +167,7 @@ class RiskManager:
         Returns:
             TP-Preis (gerundet) oder None wenn deaktiviert
         """
-        mode = self.grid_conf.tp_mode
+        mode = self._tp_mode
         
         # === Preisgrid holen falls nicht übergeben ===
         if price_list is None:
@@ -132,8 +192,8 @@ class RiskManager:
         rounded = self.calculator.round_to_tick(tp)
         
         self.logger.debug(
-            f"[TP] entry={entry_price:.6f} | side={side} | "
-            f"mode={mode.value} | tp={rounded:.6f}"
+            "[TP] entry=%.6f | side=%s | mode=%s | tp=%.6f",
+            entry_price, side, mode.value, rounded
         )
         
         return rounded
@@ -170,13 +230,88 @@ class RiskManager:
         BUY  → TP = entry × (1 + pct)
         SELL → TP = entry × (1 - pct)
         """
-        pct = float(self.grid_conf.take_profit_pct) / 100.0
+        pct = self._tp_pct
         
         if side.upper() == "BUY":
             return entry_price * (1.0 + pct)
         else:
             return entry_price * (1.0 - pct)
 
+    # =========================================================================
+    # TP/SL vektorisiert (alle Levels)
+    # =========================================================================
+
+    def calculate_tp_sl_arrays(
+        self,
+        price_list,
+        is_buy: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Berechnet TP und SL für alle Levels in einem Durchlauf
+        
+        Gleiche Formeln und Rundung wie calculate_take_profit /
+        calculate_stop_loss, aber ohne N Einzelaufrufe. Level i gehört zu
+        price_list[i].
+        
+        Args:
+            price_list: Preisgrid (aufsteigend)
+            is_buy: Bool-Array je Level (True = BUY, sonst SELL)
+        
+        Returns:
+            (tp, sl) als float64-Arrays, NaN wenn deaktiviert
+        """
+        prices = np.asarray(price_list, dtype=np.float64)
+        tp = self._tp_array(prices, is_buy)
+        sl = self._sl_array(prices, is_buy)
+        
+        round_array = self.calculator.round_to_tick_array
+        return round_array(tp), round_array(sl)
+
+    def _tp_array(self, prices: np.ndarray, is_buy: np.ndarray) -> np.ndarray:
+        """Ungerundete TP-Preise je Level (siehe _tp_next_grid / _tp_percent)"""
+        mode = self._tp_mode
+        n = prices.size
+        
+        if mode == TPMode.NEXT_GRID:
+            # BUY → nächstes Level, SELL → vorheriges Level (Ränder extrapoliert)
+            up = np.empty(n, dtype=np.float64)
+            down = np.empty(n, dtype=np.float64)
+            if n > 1:
+                up[:-1] = prices[1:]
+                up[-1] = prices[-1] + (prices[-1] - prices[-2])
+                down[1:] = prices[:-1]
+                down[0] = prices[0] - (prices[1] - prices[0])
+            return np.where(is_buy, up, down)
+        
+        if mode == TPMode.PERCENT:
+            pct = self._tp_pct
+            return np.where(is_buy, prices * (1.0 + pct), prices * (1.0 - pct))
+        
+        self.logger.warning(f"Unbekannter TP-Modus: {mode}")
+        return np.full(n, np.nan)
+
+    def _sl_array(self, prices: np.ndarray, is_buy: np.ndarray) -> np.ndarray:
+        """Ungerundete SL-Preise je Level (siehe calculate_stop_loss)"""
+        mode = self._sl_mode
+        n = prices.size
+        
+        if mode == SLMode.NONE:
+            return np.full(n, np.nan)
+        
+        if mode == SLMode.FIXED:
+            fixed = self._sl_fixed
+            if fixed is None:
+                self.logger.warning("sl_mode='fixed', aber stop_loss_price fehlt")
+                return np.full(n, np.nan)
+            return np.full(n, fixed)
+        
+        if mode == SLMode.PERCENT:
+            pct = self._sl_pct
+            return np.where(is_buy, prices * (1.0 - pct), prices * (1.0 + pct))
+        
+        self.logger.warning(f"Unbekannter SL-Modus: {mode}")
+        return np.full(n, np.nan)
+
     # =========================================================================
     # Stop-Loss Berechnung
     # =========================================================================
@@ -196,7 +331,7 @@ class RiskManager:
         Returns:
             SL-Preis (gerundet) oder None wenn deaktiviert
         """
-        mode = self.grid_conf.sl_mode
+        mode = self._sl_mode
         
         # === MODUS: none ===
         if mode == SLMode.NONE:
@@ -204,11 +339,10 @@ class RiskManager:
         
         # === MODUS: fixed ===
         elif mode == SLMode.FIXED:
-            fixed = self.grid_conf.stop_loss_price
-            if fixed is None:
+            sl = self._sl_fixed
+            if sl is None:
                 self.logger.warning("sl_mode='fixed', aber stop_loss_price fehlt")
                 return None
-            sl = float(fixed)
         
         # === MODUS: percent ===
         elif mode == SLMode.PERCENT:
@@ -225,8 +359,8 @@ class RiskManager:
         rounded = self.calculator.round_to_tick(sl)
         
         self.logger.debug(
-            f"[SL] entry={entry_price:.6f} | side={side} | "
-            f"mode={mode.value} | sl={rounded:.6f}"
+            "[SL] entry=%.6f | side=%s | mode=%s | sl=%.6f",
+            entry_price, side, mode.value, rounded
         )
         
         return rounded
@@ -238,7 +372,7 @@ class RiskManager:
         BUY  → SL unterhalb = entry × (1 - pct)
         SELL → SL oberhalb  = entry × (1 + pct)
         """
-        pct = float(self.grid_conf.stop_loss_pct) / 100
+        pct = self._sl_pct
         
         if side.upper() == "BUY":
             return entry_price * (1.0 - pct)
@@ -311,6 +445,30 @@ class RiskManager:
         
         return True
 
+    def validate_tp_sl_arrays(
+        self,
+        prices: np.ndarray,
+        is_buy: np.ndarray,
+        is_sell: np.ndarray,
+        tp: np.ndarray,
+        sl: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vektorisierte validate_tp_sl für alle Levels (ohne Logging)
+        
+        Args:
+            prices: Entry-Preise
+            is_buy / is_sell: Seiten-Masken (keins von beiden → ungültig)
+            tp / sl: TP/SL-Preise, NaN = nicht gesetzt
+        
+        Returns:
+            Bool-Array, True = valide
+        """
+        # NaN-Vergleiche sind immer False → fehlendes TP/SL macht nie ungültig
+        buy_bad = (tp <= prices) | (sl >= prices)
+        sell_bad = (tp >= prices) | (sl <= prices)
+        return (is_buy & ~buy_bad) | (is_sell & ~sell_bad)
+
     def get_risk_summary(self) -> dict:
         """
         Gibt Risk-Parameter als Dict zurück
@@ -7,6 +7,9 @@ Features:
 - TP/SL-Trigger
 - PnL-Tracking
 - Performance-Statistiken
+
+Fill- und TP/SL-Checks laufen vektorisiert über NumPy-Arrays der offenen
+Orders/Positionen (lazy neu aufgebaut, sobald sich die offene Menge ändert).
 """
 
 import logging
@@ -16,8 +19,10 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
 
+import numpy as np
+
 
-@dataclass
+@dataclass(slots=True)
 class VirtualOrder:
     """Virtuelle Order"""
     order_id: str
@@ -48,7 +53,7 @@ class VirtualOrder:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualPosition:
     """Virtuelle Position"""
     position_id: str
@@ -87,10 +92,17 @@ class VirtualOrderManager:
         self.symbol = symbol
         self.logger = logger or logging.getLogger("VirtualOrderManager")
         
-        # Order & Position Storage
+        # Order & Position Storage (komplette Historie)
         self.orders: Dict[str, VirtualOrder] = {}
         self.positions: Dict[str, VirtualPosition] = {}
         
+        # Offene Teilmengen (Einfügereihenfolge = Prüfreihenfolge) + SoA-Arrays
+        # für die Tick-Checks; None = nach Änderung neu aufbauen
+        self._open_orders: Dict[str, VirtualOrder] = {}
+        self._open_positions: Dict[str, VirtualPosition] = {}
+        self._order_arrays: Optional[tuple] = None
+        self._position_arrays: Optional[tuple] = None
+        
         # Performance Stats
         self.total_trades = 0
         self.winning_trades = 0
@@ -124,15 +136,17 @@ class VirtualOrderManager:
         )
         
         self.orders[order_id] = order
-        
-        # ✅ FIX: Formatierung außerhalb
-        tp_str = f"{tp_price:.4f}" if tp_price else "None"
-        sl_str = f"{sl_price:.4f}" if sl_price else "None"
-        
-        self.logger.debug(
-            f"[VIRTUAL] 🟢 Order platziert: {side} {qty}@{price:.4f} "
-            f"| TP={tp_str} | SL={sl_str}"
-        )
+        self._open_orders[order_id] = order
+        self._order_arrays = None
+        
+        # ✅ FIX: Formatierung nur wenn DEBUG aktiv
+        if self.logger.isEnabledFor(logging.DEBUG):
+            tp_str = "%.4f" % tp_price if tp_price else "None"
+            sl_str = "%.4f" % sl_price if sl_price else "None"
+            self.logger.debug(
+                "[VIRTUAL] 🟢 Order platziert: %s %s@%.4f | TP=%s | SL=%s",
+                side, qty, price, tp_str, sl_str
+            )
     
         return order_id
     
@@ -146,37 +160,39 @@ class VirtualOrderManager:
         Returns:
             Liste gefüllter Orders
         """
-        filled_orders = []
+        if not self._open_orders:
+            return []
         
-        for order in list(self.orders.values()):
-            if order.status != "OPEN":
-                continue
-            
-            # MARKET Orders werden sofort gefüllt
-            if order.order_type == "MARKET":
-                self._fill_order(order, current_price)
-                filled_orders.append(order)
-                continue
-            
-            # LIMIT Orders: Check ob Preis erreicht
-            should_fill = False
-            
-            if order.side == "BUY":
-                # BUY Limit: Fill wenn Preis <= Order-Preis
-                if current_price <= order.price:
-                    should_fill = True
-            
-            elif order.side == "SELL":
-                # SELL Limit: Fill wenn Preis >= Order-Preis
-                if current_price >= order.price:
-                    should_fill = True
-            
-            if should_fill:
-                self._fill_order(order, current_price)
-                filled_orders.append(order)
+        if self._order_arrays is None:
+            self._order_arrays = self._build_order_arrays()
+        orders, prices, is_buy, is_sell, is_market = self._order_arrays
+        
+        # MARKET sofort; BUY Limit bei Preis <= Order-Preis, SELL Limit bei >=
+        mask = is_market | (is_buy & (current_price <= prices)) | (is_sell & (current_price >= prices))
+        hits = np.flatnonzero(mask)
+        if not hits.size:
+            return []
         
+        filled_orders = []
+        for i in hits.tolist():
+            order = orders[i]
+            del self._open_orders[order.order_id]
+            self._fill_order(order, current_price)
+            filled_orders.append(order)
+        
+        self._order_arrays = None
         return filled_orders
     
+    def _build_order_arrays(self) -> tuple:
+        """SoA der offenen Orders: (Orders, Preis, is_buy, is_sell, is_market)"""
+        orders = tuple(self._open_orders.values())
+        n = len(orders)
+        prices = np.fromiter((o.price for o in orders), dtype=np.float64, count=n)
+        is_buy = np.fromiter((o.side == "BUY" for o in orders), dtype=bool, count=n)
+        is_sell = np.fromiter((o.side == "SELL" for o in orders), dtype=bool, count=n)
+        is_market = np.fromiter((o.order_type == "MARKET" for o in orders), dtype=bool, count=n)
+        return orders, prices, is_buy, is_sell, is_market
+    
     def _fill_order(self, order: VirtualOrder, fill_price: float):
         """Füllt Order"""
         order.status = "FILLED"
@@ -184,14 +200,14 @@ class VirtualOrderManager:
         order.filled_time = time.time()
 
         # ✅ FIX: TP/SL aus Order-Objekt holen, nicht aus Parametern!
-        tp_str = f"{order.tp_price:.4f}" if order.tp_price else "None"
-        sl_str = f"{order.sl_price:.4f}" if order.sl_price else "None"
-        
-        self.logger.info(
-            f"💰 {self.symbol} "
-            f"✅ FILL {order.side} {order.qty}@{fill_price:.4f} "
-            f"(Order @ {order.price:.4f} - TP @ {tp_str} - SL @ {sl_str})"
-        )
+        # Formatierung nur wenn INFO aktiv
+        if self.logger.isEnabledFor(logging.INFO):
+            tp_str = "%.4f" % order.tp_price if order.tp_price else "None"
+            sl_str = "%.4f" % order.sl_price if order.sl_price else "None"
+            self.logger.info(
+                "💰 %s ✅ FILL %s %s@%.4f (Order @ %.4f - TP @ %s - SL @ %s)",
+                self.symbol, order.side, order.qty, fill_price, order.price, tp_str, sl_str
+            )
             
         # Erstelle Position
         self._create_position(order, fill_price)
@@ -215,9 +231,12 @@ class VirtualOrderManager:
         position.fill_price = fill_price
         
         self.positions[position_id] = position
+        self._open_positions[position_id] = position
+        self._position_arrays = None
         
         self.logger.debug(
-            f"[VIRTUAL] 📍 Position eröffnet: {position.side} {position.qty} @ Grid={order.price:.4f} Fill={fill_price:.4f}"
+            "[VIRTUAL] 📍 Position eröffnet: %s %s @ Grid=%.4f Fill=%.4f",
+            position.side, position.qty, order.price, fill_price
         )
     
     def check_tp_sl(self, current_price: float) -> List[VirtualPosition]:
@@ -230,46 +249,44 @@ class VirtualOrderManager:
         Returns:
             Liste geschlossener Positionen
         """
-        closed_positions = []
+        if not self._open_positions:
+            return []
         
-        for position in list(self.positions.values()):
-            if position.closed_at:
-                continue
-            
-            should_close = False
-            close_reason = ""
-            close_price = current_price
-            
-            # TP Check
-            if position.tp_price:
-                if position.side == "LONG" and current_price >= position.tp_price:
-                    should_close = True
-                    close_reason = "TP"
-                    close_price = position.tp_price
-                
-                elif position.side == "SHORT" and current_price <= position.tp_price:
-                    should_close = True
-                    close_reason = "TP"
-                    close_price = position.tp_price
-            
-            # SL Check (nur wenn nicht schon TP)
-            if not should_close and position.sl_price:
-                if position.side == "LONG" and current_price <= position.sl_price:
-                    should_close = True
-                    close_reason = "SL"
-                    close_price = position.sl_price
-                
-                elif position.side == "SHORT" and current_price >= position.sl_price:
-                    should_close = True
-                    close_reason = "SL"
-                    close_price = position.sl_price
-            
-            if should_close:
-                self._close_position(position, close_price, close_reason)
-                closed_positions.append(position)
+        if self._position_arrays is None:
+            self._position_arrays = self._build_position_arrays()
+        positions, tp, sl, is_long, is_short = self._position_arrays
         
+        # TP hat Vorrang vor SL; deaktiviertes TP/SL ist NaN → Vergleich immer False
+        tp_hit = (is_long & (current_price >= tp)) | (is_short & (current_price <= tp))
+        sl_hit = (is_long & (current_price <= sl)) | (is_short & (current_price >= sl))
+        hits = np.flatnonzero(tp_hit | sl_hit)
+        if not hits.size:
+            return []
+        
+        closed_positions = []
+        for i in hits.tolist():
+            position = positions[i]
+            del self._open_positions[position.position_id]
+            if tp_hit[i]:
+                self._close_position(position, position.tp_price, "TP")
+            else:
+                self._close_position(position, position.sl_price, "SL")
+            closed_positions.append(position)
+        
+        self._position_arrays = None
         return closed_positions
     
+    def _build_position_arrays(self) -> tuple:
+        """SoA der offenen Positionen: (Positionen, TP, SL, is_long, is_short)"""
+        positions = tuple(self._open_positions.values())
+        n = len(positions)
+        nan = float("nan")
+        tp = np.fromiter((p.tp_price or nan for p in positions), dtype=np.float64, count=n)
+        sl = np.fromiter((p.sl_price or nan for p in positions), dtype=np.float64, count=n)
+        is_long = np.fromiter((p.side == "LONG" for p in positions), dtype=bool, count=n)
+        is_short = np.fromiter((p.side == "SHORT" for p in positions), dtype=bool, count=n)
+        return positions, tp, sl, is_long, is_short
+    
     def _close_position(self, position: VirtualPosition, close_price: float, reason: str):
         """Schließt Position"""
         position.calculate_pnl(close_price)
@@ -308,16 +325,18 @@ class VirtualOrderManager:
             return False
         
         order.status = "CANCELLED"
-        self.logger.debug(f"[VIRTUAL] ❌ Order cancelled: {order_id}")
+        self._open_orders.pop(order_id, None)
+        self._order_arrays = None
+        self.logger.debug("[VIRTUAL] ❌ Order cancelled: %s", order_id)
         return True
     
     def get_open_orders(self) -> List[VirtualOrder]:
         """Gibt alle offenen Orders zurück"""
-        return [o for o in self.orders.values() if o.status == "OPEN"]
+        return list(self._open_orders.values())
     
     def get_open_positions(self) -> List[VirtualPosition]:
         """Gibt alle offenen Positionen zurück"""
-        return [p for p in self.positions.values() if p.closed_at is None]
+        return list(self._open_positions.values())
     
     def get_stats(self) -> dict:
         """Gibt Performance-Statistiken zurück"""
@@ -349,8 +368,8 @@ class VirtualOrderManager:
             "avg_pnl_pct": avg_pnl_pct,
             "best_trade": self.best_trade,
             "worst_trade": self.worst_trade,
-            "open_orders": len(self.get_open_orders()),
-            "open_positions": len(self.get_open_positions()),
+            "open_orders": len(self._open_orders),
+            "open_positions": len(self._open_positions),
         }
     
     def print_stats(self):
@@ -0,0 +1,427 @@
+# strategies/GRID/models/grid_level.py
+"""
+GridLevel - Zentrale Level-Definition für alle Manager
+
+Status als Bitflag (``state``) statt separater Bools, damit der
+Hot-Path-Check "aktiv, gefüllt oder Position offen" ein einziger
+Attribut-Zugriff ist. Das LevelBook spiegelt die Levels zusätzlich als
+NumPy-Spalten (SoA) für vektorisierte Scans.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from utils.numba_compat import njit, NUMBA_AVAILABLE
+
+# Bitflags für GridLevel.state
+LEVEL_ACTIVE = 1
+LEVEL_FILLED = 2
+LEVEL_POSITION = 4
+LEVEL_BUSY = LEVEL_ACTIVE | LEVEL_FILLED  # zählt für Net-Position
+
+# Seite / Grid-Richtung als Bitmaske (Richtung & Seite != 0 → Level erlaubt)
+SIDE_BUY = 1
+SIDE_SELL = 2
+SIDE_BITS = {"BUY": SIDE_BUY, "SELL": SIDE_SELL}
+
+DIR_LONG = SIDE_BUY
+DIR_SHORT = SIDE_SELL
+DIR_BOTH = DIR_LONG | DIR_SHORT
+DIRECTION_BITS = {"long": DIR_LONG, "short": DIR_SHORT, "both": DIR_BOTH}
+
+
+@njit(cache=True, boundscheck=False)
+def _scan_touched(prices, is_buy, is_sell, states, current_price, distance, allow_long, allow_short):
+    """
+    Entry-on-Touch-Kernel (kompiliert mit numba, sonst ungenutzt)
+
+    Eine Schleife ohne Masken-Temporaries; Bedingungen wie in
+    LevelBook.touched_indices.
+    """
+    n = prices.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    count = 0
+    for i in range(n):
+        if states[i] != 0:
+            continue
+        price = prices[i]
+        if allow_long and is_buy[i] and price + distance <= current_price:
+            out[count] = i
+            count += 1
+        elif allow_short and is_sell[i] and price - distance >= current_price:
+            out[count] = i
+            count += 1
+    return out[:count]
+
+
+_kernels_warm = False
+
+
+def warm_up_kernels() -> None:
+    """
+    numba-Kernel einmal mit Dummy-Spalten kompilieren (gleiche dtypes wie
+    LevelBook), damit der erste Touch-Scan nicht die JIT-Latenz trägt.
+    Ohne numba ein No-op; mit cache=True lädt numba danach von der Platte.
+    """
+    global _kernels_warm
+    if _kernels_warm or not NUMBA_AVAILABLE:
+        return
+    prices = np.zeros(2, dtype=np.float64)
+    flags = np.zeros(2, dtype=bool)
+    states = np.zeros(2, dtype=np.uint8)
+    _scan_touched(prices, flags, flags, states, 0.0, 0.0, True, True)
+    _kernels_warm = True
+
+
+@dataclass(slots=True)
+class GridLevel:
+    index: int
+    price: float
+    side: str
+    order_id: Optional[str] = None
+    state: int = 0  # Bitflag: LEVEL_ACTIVE | LEVEL_FILLED | LEVEL_POSITION
+    position_id: Optional[str] = None
+    tp: Optional[float] = None
+    sl: Optional[float] = None
+    valid: bool = True  # TP/SL-Validierung (einmal bei Grid-Aufbau/Rebalance)
+    book: Optional["LevelBook"] = field(default=None, repr=False, compare=False)
+    side_bits: int = field(default=0, repr=False, compare=False)  # SIDE_BUY / SIDE_SELL
+
+    def __post_init__(self) -> None:
+        self.side_bits = SIDE_BITS.get(self.side, 0)
+
+    def _set_state(self, new: int) -> None:
+        """Einziger Schreibpfad für Status-Übergänge (hält LevelBook aktuell)"""
+        old = self.state
+        if new == old:
+            return
+        self.state = new
+        if self.book is not None:
+            self.book.on_state_change(self, old, new)
+
+    def set_order(self, order_id: Optional[str]) -> None:
+        """Order-ID setzen und im LevelBook-Index registrieren (O(1)-Lookup bei Fills)"""
+        self.order_id = order_id
+        if order_id is not None and self.book is not None:
+            self.book._by_order[order_id] = self
+
+    @property
+    def active(self) -> bool:
+        return bool(self.state & LEVEL_ACTIVE)
+
+    @active.setter
+    def active(self, value: bool) -> None:
+        self._set_state(self.state | LEVEL_ACTIVE if value else self.state & ~LEVEL_ACTIVE)
+
+    @property
+    def filled(self) -> bool:
+        return bool(self.state & LEVEL_FILLED)
+
+    @filled.setter
+    def filled(self, value: bool) -> None:
+        self._set_state(self.state | LEVEL_FILLED if value else self.state & ~LEVEL_FILLED)
+
+    @property
+    def position_open(self) -> bool:
+        return bool(self.state & LEVEL_POSITION)
+
+    @position_open.setter
+    def position_open(self, value: bool) -> None:
+        self._set_state(self.state | LEVEL_POSITION if value else self.state & ~LEVEL_POSITION)
+
+    def __repr__(self) -> str:
+        state = self.state
+        status = "FILLED" if state & LEVEL_FILLED else ("ACTIVE" if state & LEVEL_ACTIVE else "IDLE")
+        return "<GridLevel #%d %s @ %s [%s]>" % (self.index, self.side, self.price, status)
+
+
+class LevelBook:
+    """
+    Inkrementelle Zähler + SoA-Spalten über eine Level-Liste
+
+    Statt bei jeder Net-Position-Berechnung oder jedem Touch-Scan alle
+    Levels zu durchlaufen, werden Zähler und ``states``-Spalte bei jedem
+    Status-Übergang (GridLevel.active/filled/position_open) angepasst.
+
+    - n_active:   Levels mit ACTIVE-Bit
+    - n_filled:   Levels mit FILLED-Bit
+    - net_levels: BUY minus SELL über alle Levels mit ACTIVE oder FILLED
+                  (gefüllt oder pending – Basis für Net-Position)
+    - prices / is_buy / is_sell / states: NumPy-Spalten, Position = level.index
+    - version:    Zähler je Status-Übergang (invalidiert abgeleitete Caches)
+    """
+
+    __slots__ = (
+        "levels", "n_active", "n_filled", "net_levels",
+        "prices", "is_buy", "is_sell", "states",
+        "version", "_bounds_key", "_bounds", "_sorted", "_by_order", "_by_order_version",
+    )
+
+    def __init__(self, levels: Optional[List[GridLevel]] = None):
+        levels = levels if levels is not None else []
+        self.levels = levels
+        self.n_active = 0
+        self.n_filled = 0
+        self.net_levels = 0
+
+        n = len(levels)
+        self.prices = np.fromiter((lvl.price for lvl in levels), dtype=np.float64, count=n)
+        self.is_buy = np.fromiter((lvl.side_bits & SIDE_BUY for lvl in levels), dtype=bool, count=n)
+        self.is_sell = np.fromiter((lvl.side_bits & SIDE_SELL for lvl in levels), dtype=bool, count=n)
+        self.states = np.zeros(n, dtype=np.uint8)
+        self.version = 0
+        self._bounds_key = None
+        self._bounds = (float("inf"), float("-inf"))
+        self._sorted = bool(np.all(self.prices[1:] >= self.prices[:-1]))
+        self._by_order: dict = {}
+        self._by_order_version = -1
+
+        for i, lvl in enumerate(levels):
+            if lvl.index != i:
+                raise ValueError(f"GridLevel #{lvl.index} an Position {i} (Index muss Position entsprechen)")
+            lvl.book = self
+            self.on_state_change(lvl, 0, lvl.state)
+        self._rebuild_order_index()
+
+    def on_state_change(self, level: GridLevel, old: int, new: int) -> None:
+        """Passt Zähler und states-Spalte an einen Übergang old → new an"""
+        self.states[level.index] = new
+        self.version += 1
+        self.n_active += (new & LEVEL_ACTIVE) - (old & LEVEL_ACTIVE)
+        self.n_filled += ((new & LEVEL_FILLED) - (old & LEVEL_FILLED)) >> 1
+
+        delta = bool(new & LEVEL_BUSY) - bool(old & LEVEL_BUSY)
+        if delta:
+            side_bits = level.side_bits
+            if side_bits & SIDE_BUY:
+                self.net_levels += delta
+            elif side_bits & SIDE_SELL:
+                self.net_levels -= delta
+
+    def level_for_order(self, order_id) -> Optional[GridLevel]:
+        """
+        Level zu einer Order-ID (Hash-Lookup statt Listen-Scan)
+        
+        GridLevel.set_order() registriert neue IDs sofort. Direkte Zuweisungen
+        an lvl.order_id sind weiter erlaubt: jeder Treffer wird gegen
+        lvl.order_id geprüft, und bei einem Fehlgriff wird der Index neu
+        aufgebaut – aber nur, wenn sich seit dem letzten Aufbau ein Status
+        geändert hat (fremde Order-IDs kosten so keinen Vollscan pro Lookup).
+        """
+        if order_id is None:
+            return None
+        lvl = self._by_order.get(order_id)
+        if lvl is not None and lvl.order_id == order_id:
+            return lvl
+        
+        if self._by_order_version == self.version:
+            return None
+        self._rebuild_order_index()
+        return self._by_order.get(order_id)
+
+    def _rebuild_order_index(self) -> None:
+        """Order-ID-Index neu aufbauen – rückwärts, damit bei Duplikaten das erste Level gewinnt"""
+        self._by_order = {
+            lvl.order_id: lvl for lvl in reversed(self.levels) if lvl.order_id is not None
+        }
+        self._by_order_version = self.version
+
+    def find_near(self, price: float, tolerance: float, state_mask: int = 0) -> Optional[GridLevel]:
+        """
+        Erstes Level (aufsteigend) mit |level.price - price| < tolerance
+        
+        Binary Search über die sortierte prices-Spalte statt Vollscan.
+        
+        Args:
+            price: Gesuchter Preis
+            tolerance: Maximale Abweichung (exklusiv)
+            state_mask: Nur Levels mit einem dieser Status-Bits (0 = alle)
+        """
+        levels = self.levels
+        n = len(levels)
+        # Unsortiert (nicht über GridCalculator erzeugt) → linearer Scan
+        i = max(int(np.searchsorted(self.prices, price - tolerance)) - 1, 0) if self._sorted else 0
+        
+        while i < n:
+            lvl = levels[i]
+            diff = lvl.price - price
+            if diff >= tolerance and self._sorted:
+                break
+            if abs(diff) < tolerance and (not state_mask or lvl.state & state_mask):
+                return lvl
+            i += 1
+        return None
+
+    def risk_count(self, current_price: float, side_bits: int) -> int:
+        """
+        Hedge-Risiko: aktive Orders auf der Verlustseite + gefüllte/offene Levels
+
+        - SIDE_BUY  (long):  aktive BUY-Orders unter current_price
+        - SIDE_SELL (short): aktive SELL-Orders über current_price
+        """
+        states = self.states
+        if side_bits & SIDE_BUY:
+            exposed = self.is_buy & (self.prices < current_price)
+        else:
+            exposed = self.is_sell & (self.prices > current_price)
+        exposed &= (states & LEVEL_ACTIVE) != 0
+        holding = (states & (LEVEL_FILLED | LEVEL_POSITION)) != 0
+        return int(np.count_nonzero(exposed)) + int(np.count_nonzero(holding))
+
+    def touch_bounds(
+        self,
+        distance: float,
+        allow_long: bool = True,
+        allow_short: bool = True
+    ) -> tuple:
+        """
+        Nächste Trigger-Preise für Entry-on-Touch
+        
+        Solange ``sell_trigger < current_price < buy_trigger`` gilt, kann
+        kein freies Level berührt sein. Neu berechnet wird nur nach einem
+        Status-Übergang oder geändertem Abstand, sonst aus dem Cache.
+        
+        Returns:
+            (buy_trigger, sell_trigger) – inf/-inf wenn keine freie Seite
+        """
+        key = (self.version, distance, allow_long, allow_short)
+        if key == self._bounds_key:
+            return self._bounds
+        
+        idle = self.states == 0
+        buy_trigger = float("inf")
+        sell_trigger = float("-inf")
+        
+        if allow_long:
+            buy_prices = self.prices[idle & self.is_buy]
+            if buy_prices.size:
+                buy_trigger = float((buy_prices + distance).min())
+        if allow_short:
+            sell_prices = self.prices[idle & self.is_sell]
+            if sell_prices.size:
+                sell_trigger = float((sell_prices - distance).max())
+        
+        self._bounds_key = key
+        self._bounds = (buy_trigger, sell_trigger)
+        return self._bounds
+
+    def touched_indices(
+        self,
+        current_price: float,
+        distance: float,
+        allow_long: bool = True,
+        allow_short: bool = True
+    ) -> np.ndarray:
+        """
+        Indizes freier Levels, die für Entry-on-Touch weit genug entfernt sind
+
+        - BUY:  current_price >= price + distance
+        - SELL: current_price <= price - distance
+
+        Returns:
+            Aufsteigende Level-Indizes (= aufsteigende Preise)
+        """
+        if NUMBA_AVAILABLE:
+            return _scan_touched(
+                self.prices, self.is_buy, self.is_sell, self.states,
+                current_price, distance, allow_long, allow_short
+            )
+
+        if self._sorted:
+            hit = self._touched_sorted(current_price, distance, allow_long, allow_short)
+            if hit is not None:
+                return hit
+
+        prices = self.prices
+        if allow_long and allow_short:
+            hit = (self.is_buy & (prices + distance <= current_price)) | (
+                self.is_sell & (prices - distance >= current_price)
+            )
+        elif allow_long:
+            hit = self.is_buy & (prices + distance <= current_price)
+        elif allow_short:
+            hit = self.is_sell & (prices - distance >= current_price)
+        else:
+            return np.empty(0, dtype=np.intp)
+
+        hit &= self.states == 0
+        return np.flatnonzero(hit)
+
+    def _touched_sorted(
+        self,
+        current_price: float,
+        distance: float,
+        allow_long: bool,
+        allow_short: bool
+    ) -> Optional[np.ndarray]:
+        """
+        touched_indices für aufsteigende Preise per Binary Search
+
+        price + distance ist monoton in price → berührte BUY-Levels bilden ein
+        Präfix, berührte SELL-Levels ein Suffix. Die Grenzen kommen aus
+        searchsorted und werden mit exakt denselben Float-Vergleichen wie im
+        Masken-Pfad nachjustiert; nur Präfix/Suffix werden maskiert.
+
+        Returns:
+            Indizes wie touched_indices, None wenn sich Präfix und Suffix
+            überlappen (→ Masken-Pfad)
+        """
+        prices = self.prices
+        n = prices.shape[0]
+        states = self.states
+        buy_end = 0
+        sell_start = n
+
+        if allow_long:
+            k = int(np.searchsorted(prices, current_price - distance, side="right"))
+            while k < n and prices[k] + distance <= current_price:
+                k += 1
+            while k > 0 and prices[k - 1] + distance > current_price:
+                k -= 1
+            buy_end = k
+        if allow_short:
+            j = int(np.searchsorted(prices, current_price + distance, side="left"))
+            while j > 0 and prices[j - 1] - distance >= current_price:
+                j -= 1
+            while j < n and prices[j] - distance < current_price:
+                j += 1
+            sell_start = j
+
+        if buy_end > sell_start:
+            return None
+
+        buy_hit = np.flatnonzero(self.is_buy[:buy_end] & (states[:buy_end] == 0))
+        if sell_start >= n:
+            return buy_hit
+        sell_hit = np.flatnonzero(self.is_sell[sell_start:] & (states[sell_start:] == 0)) + sell_start
+        if not buy_end:
+            return sell_hit
+        return np.concatenate((buy_hit, sell_hit))
+
+
+def count_risk_levels(levels: List[GridLevel], current_price: float, side_bits: int) -> int:
+    """
+    LevelBook.risk_count für eine Level-Liste
+
+    Gehört die Liste zu einem LevelBook, wird vektorisiert gezählt, sonst
+    (Snapshot/fremde Liste) in einem einzigen Durchlauf mit identischer Logik.
+    """
+    if levels:
+        book = levels[0].book
+        if book is not None and book.levels is levels:
+            return book.risk_count(current_price, side_bits)
+
+    below = bool(side_bits & SIDE_BUY)
+    side_mask = SIDE_BUY if below else SIDE_SELL
+    count = 0
+    for lvl in levels:
+        state = lvl.state
+        if state & (LEVEL_FILLED | LEVEL_POSITION):
+            count += 1
+        if state & LEVEL_ACTIVE and lvl.side_bits & side_mask and (
+            lvl.price < current_price if below else lvl.price > current_price
+        ):
+            count += 1
+    return count
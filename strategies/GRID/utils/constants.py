@@ -49,8 +49,11 @@ LOG_ROTATION_BACKUP_COUNT = 5
 HEDGE_MIN_SIZE = 0.001
 HEDGE_PRICE_TOLERANCE = 0.0001
 HEDGE_CHECK_INTERVAL = 10  # Sekunden zwischen Hedge-Checks
+HEDGE_WARN_MIN_INTERVAL = 30.0  # Sekunden zwischen gleichen Hedge-Warnungen
 HEDGE_MAX_TRIGGER_OFFSET = 10.0
 HEDGE_MIN_TRIGGER_OFFSET = 0.1
 
 # === Grid Placement (NEU!) ===
-GRID_ORDER_MIN_DISTANCE_STEPS = 1  # Mindestabstand in Grid-Steps
\ No newline at end of file
+GRID_ORDER_MIN_DISTANCE_STEPS = 1  # Mindestabstand in Grid-Steps
+INITIAL_ORDER_CONCURRENCY = 10  # Max. parallele REST-Calls beim Initial-Placement
+BATCH_ORDER_MAX_SIZE = 20  # Max. Orders pro batch_order Request
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Optionale Numba-Beschleunigung
+
+numba ist keine Pflicht-Abhängigkeit (nicht in requirements.txt). Ist es
+installiert, kompiliert ``njit`` die Hot-Path-Kernels; sonst ist ``njit``
+ein No-op-Decorator und Aufrufer wählen über ``NUMBA_AVAILABLE`` ihren
+NumPy-Pfad.
+"""
+
+try:
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """numba.njit falls verfügbar, sonst Funktion unverändert zurückgeben"""
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+
+    # @njit ohne Klammern
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    # @njit(cache=True, ...)
+    return lambda func: func